@@ -3,16 +3,23 @@ Matrica Networks - Authentication Module
 Handles user authentication, session management, and security
 """
 
+import os
+import base64
 import hashlib
 import hmac
 import secrets
 import time
 import json
+import atexit
 import logging
-from datetime import datetime, timedelta
+import queue
+import threading
+from datetime import datetime
 from typing import Optional, Dict, List, Any
 import sqlite3
+from collections import OrderedDict
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,6 +36,19 @@ class SecurityConfig:
     SESSION_TOKEN_LENGTH = 64
     SESSION_EXPIRY_HOURS = 8
     SESSION_REMEMBER_HOURS = 168  # 7 days
+    SESSION_CACHE_TTL_SECONDS = 5
+    SESSION_CACHE_MAX_ENTRIES = 10000
+    SESSION_RETENTION_DAYS = 30  # inactive sessions kept for auditing before purge
+    
+    # Recently verified credentials (skips PBKDF2 on repeated logins)
+    AUTH_CACHE_TTL_SECONDS = 30
+    AUTH_CACHE_MAX_ENTRIES = 1024
+    
+    # Prepared statements kept per pooled connection
+    STATEMENT_CACHE_SIZE = 256
+    
+    # Idle connections kept open per database path
+    CONNECTION_POOL_SIZE = 8
     
     # Rate limiting
     MAX_LOGIN_ATTEMPTS = 5
@@ -43,9 +63,93 @@ class SecurityConfig:
         'Content-Security-Policy': "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline';"
     }
 
+# Per-process secret used to key the verified-credential cache; never persisted
+_AUTH_CACHE_PEPPER = secrets.token_bytes(32)
+
+# Worker pool for key derivation. The C loop releases the GIL, so concurrent
+# logins hash on separate cores instead of queueing behind each other.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                    thread_name_prefix='pbkdf2')
+
+# Idle connections keyed on database path, shared across threads. The WSGI server runs every
+# request on a fresh thread, so a per-thread pool would reconnect on every request.
+_idle_connections = {}
+_pool_lock = threading.Lock()
+
+def _open_pooled_connection(db_path: str) -> sqlite3.Connection:
+    """Open a long-lived connection tuned for concurrent readers"""
+    # Autocommit: single statements commit themselves, multi-statement work uses transaction()
+    conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None,
+                           cached_statements=SecurityConfig.STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    return conn
+
+@contextmanager
+def pooled_connection(db_path: str):
+    """Check out an idle connection to db_path, opening one if none is available"""
+    with _pool_lock:
+        idle = _idle_connections.get(db_path)
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = _open_pooled_connection(db_path)
+    
+    try:
+        yield conn
+    finally:
+        # Never leak an open transaction to the next user of this connection
+        if conn.in_transaction:
+            conn.rollback()
+        with _pool_lock:
+            idle = _idle_connections.setdefault(db_path, [])
+            if len(idle) < SecurityConfig.CONNECTION_POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """Run a block of statements on an autocommit connection as one write transaction"""
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
+@atexit.register
+def _close_pooled_connections():
+    """Close every idle pooled connection at interpreter shutdown"""
+    with _pool_lock:
+        idle = [conn for connections in _idle_connections.values() for conn in connections]
+        _idle_connections.clear()
+    for conn in idle:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
 class RateLimiter:
     """Handle rate limiting for authentication attempts"""
     
+    # Hot-path statements, kept as constants so the connection's statement cache reuses them
+    SELECT_SQL = 'SELECT * FROM login_attempts WHERE identifier = ?'
+    
+    RECORD_FAILURE_SQL = '''
+        INSERT INTO login_attempts (identifier, attempts, first_attempt, last_attempt)
+        VALUES (?, 1, ?, ?)
+        ON CONFLICT(identifier) DO UPDATE SET
+            attempts = attempts + 1,
+            last_attempt = excluded.last_attempt,
+            locked_until = CASE WHEN attempts + 1 >= ? THEN ? ELSE NULL END
+    '''
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._init_rate_limit_table()
@@ -54,95 +158,137 @@ class RateLimiter:
         """Initialize rate limiting table"""
         with self._get_db_connection() as conn:
             conn.execute('''
-                CREATE TABLE IF NOT EXISTS rate_limits (
+                CREATE TABLE IF NOT EXISTS login_attempts (
                     identifier TEXT PRIMARY KEY,
                     attempts INTEGER DEFAULT 0,
-                    first_attempt TIMESTAMP,
-                    last_attempt TIMESTAMP,
-                    locked_until TIMESTAMP
+                    first_attempt INTEGER,
+                    last_attempt INTEGER,
+                    locked_until INTEGER
                 )
             ''')
-            conn.commit()
     
-    @contextmanager
     def _get_db_connection(self):
-        """Get database connection with proper error handling"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        finally:
-            if conn:
-                conn.close()
+        """Check out a connection from the shared pool"""
+        return pooled_connection(self.db_path)
     
     def check_rate_limit(self, identifier: str) -> Dict[str, Any]:
         """Check if identifier is rate limited"""
         with self._get_db_connection() as conn:
-            cursor = conn.execute('''
-                SELECT * FROM rate_limits WHERE identifier = ?
-            ''', (identifier,))
+            cursor = conn.execute(self.SELECT_SQL, (identifier,))
             
             record = cursor.fetchone()
-            current_time = datetime.now()
+            current_time = int(time.time())
             
             if not record:
                 return {'allowed': True, 'attempts': 0}
             
+            locked_until = record['locked_until']
+            
             # Check if lockout period has expired
-            if record['locked_until'] and datetime.fromisoformat(record['locked_until']) > current_time:
-                time_remaining = datetime.fromisoformat(record['locked_until']) - current_time
+            if locked_until and locked_until > current_time:
                 return {
                     'allowed': False,
                     'attempts': record['attempts'],
-                    'locked_until': record['locked_until'],
-                    'time_remaining_minutes': int(time_remaining.total_seconds() / 60)
+                    'locked_until': locked_until,
+                    'time_remaining_minutes': (locked_until - current_time) // 60
                 }
             
-            # Reset if lockout expired
-            if record['locked_until'] and datetime.fromisoformat(record['locked_until']) <= current_time:
+            # Reset if lockout expired (guarded so a concurrent fresh lockout is kept)
+            if locked_until:
                 conn.execute('''
-                    UPDATE rate_limits 
+                    UPDATE login_attempts 
                     SET attempts = 0, first_attempt = NULL, last_attempt = NULL, locked_until = NULL
-                    WHERE identifier = ?
-                ''', (identifier,))
-                conn.commit()
+                    WHERE identifier = ? AND locked_until <= ?
+                ''', (identifier, current_time))
                 return {'allowed': True, 'attempts': 0}
             
             return {'allowed': record['attempts'] < SecurityConfig.MAX_LOGIN_ATTEMPTS, 'attempts': record['attempts']}
     
     def record_attempt(self, identifier: str, success: bool = False):
         """Record a login attempt"""
-        current_time = datetime.now()
+        current_time = int(time.time())
         
         with self._get_db_connection() as conn:
             if success:
                 # Reset on successful login
-                conn.execute('DELETE FROM rate_limits WHERE identifier = ?', (identifier,))
+                conn.execute('DELETE FROM login_attempts WHERE identifier = ?', (identifier,))
             else:
-                # Increment failed attempts
-                cursor = conn.execute('SELECT * FROM rate_limits WHERE identifier = ?', (identifier,))
-                record = cursor.fetchone()
-                
-                if record:
-                    new_attempts = record['attempts'] + 1
-                    locked_until = None
-                    
-                    if new_attempts >= SecurityConfig.MAX_LOGIN_ATTEMPTS:
-                        locked_until = (current_time + timedelta(minutes=SecurityConfig.LOCKOUT_DURATION_MINUTES)).isoformat()
-                    
-                    conn.execute('''
-                        UPDATE rate_limits 
-                        SET attempts = ?, last_attempt = ?, locked_until = ?
-                        WHERE identifier = ?
-                    ''', (new_attempts, current_time.isoformat(), locked_until, identifier))
-                else:
-                    conn.execute('''
-                        INSERT INTO rate_limits (identifier, attempts, first_attempt, last_attempt)
-                        VALUES (?, 1, ?, ?)
-                    ''', (identifier, current_time.isoformat(), current_time.isoformat()))
-            
-            conn.commit()
+                # Increment failed attempts atomically, locking once the limit is reached
+                locked_until = current_time + SecurityConfig.LOCKOUT_DURATION_MINUTES * 60
+                conn.execute(self.RECORD_FAILURE_SQL, (
+                    identifier, current_time, current_time, SecurityConfig.MAX_LOGIN_ATTEMPTS, locked_until
+                ))
+
+# Common passwords rejected by PasswordPolicy (compared lowercased)
+_COMMON_PASSWORDS = frozenset({
+    'password', '123456', 'qwerty', 'admin', 'letmein',
+    'password1', 'password123', '12345678', '123456789', '1234567890',
+    'qwerty123', 'iloveyou', 'welcome', 'welcome1', 'monkey', 'dragon',
+    'football', 'baseball', 'sunshine', 'princess', 'abc123', 'trustno1',
+    'passw0rd', 'p@ssw0rd', 'admin123', 'changeme', 'master', 'login',
+})
+
+# Negative pre-screen: a password whose length matches no blocklist entry
+# cannot be common, so the lowercase copy and set probe are skipped
+_COMMON_PASSWORD_LENGTHS = frozenset(len(p) for p in _COMMON_PASSWORDS)
+
+def _is_common_password(password: str) -> bool:
+    """Check password against the common-password blocklist"""
+    if len(password) not in _COMMON_PASSWORD_LENGTHS:
+        return False
+    return password.lower() in _COMMON_PASSWORDS
+
+# Character class bits produced by _classify_password
+CHAR_UPPER = 1
+CHAR_LOWER = 2
+CHAR_DIGIT = 4
+CHAR_SYMBOL = 8
+
+PASSWORD_SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+def _build_ascii_class_table() -> bytes:
+    """Build the ASCII lookup table used by _classify_password"""
+    table = bytearray(128)
+    for code in range(128):
+        c = chr(code)
+        if c.isupper():
+            table[code] = CHAR_UPPER
+        elif c.islower():
+            table[code] = CHAR_LOWER
+        elif c.isdigit():
+            table[code] = CHAR_DIGIT
+        elif c in PASSWORD_SYMBOLS:
+            table[code] = CHAR_SYMBOL
+    return bytes(table)
+
+_ASCII_CLASS_TABLE = _build_ascii_class_table()
+
+# str.translate table mapping each classified ASCII character to chr(class bit)
+# and deleting the rest, so ASCII passwords are classified entirely in C
+_ASCII_CLASS_TRANSLATION = {code: chr(bit) for code, bit in enumerate(_ASCII_CLASS_TABLE) if bit}
+_ASCII_CLASS_TRANSLATION.update({code: None for code, bit in enumerate(_ASCII_CLASS_TABLE) if not bit})
+
+def _classify_password(password: str) -> int:
+    """Return a bitmask of the character classes present in password"""
+    if password.isascii():
+        mask = 0
+        for bit in set(password.translate(_ASCII_CLASS_TRANSLATION)):
+            mask |= ord(bit)
+        return mask
+    
+    table = _ASCII_CLASS_TABLE
+    mask = 0
+    for c in password:
+        code = ord(c)
+        if code < 128:
+            mask |= table[code]
+        elif c.isupper():
+            mask |= CHAR_UPPER
+        elif c.islower():
+            mask |= CHAR_LOWER
+        elif c.isdigit():
+            mask |= CHAR_DIGIT
+    return mask
 
 class PasswordPolicy:
     """Password policy enforcement"""
@@ -158,42 +304,46 @@ class PasswordPolicy:
         if len(password) > 128:
             errors.append("Password must be less than 128 characters")
         
-        if not any(c.isupper() for c in password):
+        char_classes = _classify_password(password)
+        
+        if not char_classes & CHAR_UPPER:
             errors.append("Password must contain at least one uppercase letter")
         
-        if not any(c.islower() for c in password):
+        if not char_classes & CHAR_LOWER:
             errors.append("Password must contain at least one lowercase letter")
         
-        if not any(c.isdigit() for c in password):
+        if not char_classes & CHAR_DIGIT:
             errors.append("Password must contain at least one number")
         
-        # Check for common passwords (simplified check)
-        common_passwords = ['password', '123456', 'qwerty', 'admin', 'letmein']
-        if password.lower() in common_passwords:
+        # Check for common passwords
+        if _is_common_password(password):
             errors.append("Password is too common")
         
         return {
             'valid': len(errors) == 0,
             'errors': errors,
-            'strength': PasswordPolicy._calculate_strength(password)
+            'strength': PasswordPolicy._calculate_strength(password, char_classes)
         }
     
     @staticmethod
-    def _calculate_strength(password: str) -> str:
+    def _calculate_strength(password: str, char_classes: int = None) -> str:
         """Calculate password strength"""
+        if char_classes is None:
+            char_classes = _classify_password(password)
+        
         score = 0
         
         # Length bonus
         score += min(len(password), 25)
         
         # Character variety
-        if any(c.isupper() for c in password):
+        if char_classes & CHAR_UPPER:
             score += 6
-        if any(c.islower() for c in password):
+        if char_classes & CHAR_LOWER:
             score += 6
-        if any(c.isdigit() for c in password):
+        if char_classes & CHAR_DIGIT:
             score += 6
-        if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+        if char_classes & CHAR_SYMBOL:
             score += 6
         
         # Patterns penalty
@@ -210,9 +360,24 @@ class PasswordPolicy:
 class AuditLogger:
     """Security audit logging"""
     
+    # Background writer batching
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL_SECONDS = 0.05
+    
+    INSERT_SQL = '''
+        INSERT INTO audit_logs (event_type, user_id, username, client_ip, user_agent, details, success, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._init_audit_table()
+        
+        # Events are queued by callers and written in batches by a single thread
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, name='audit-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
     
     def _init_audit_table(self):
         """Initialize audit log table"""
@@ -230,55 +395,104 @@ class AuditLogger:
                     success BOOLEAN
                 )
             ''')
-            conn.commit()
     
-    @contextmanager
     def _get_db_connection(self):
-        """Get database connection with proper error handling"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        finally:
-            if conn:
-                conn.close()
+        """Check out a connection from the shared pool"""
+        return pooled_connection(self.db_path)
     
     def log_event(self, event_type: str, user_id: int = None, username: str = None, 
                   client_ip: str = None, user_agent: str = None, details: Dict = None, success: bool = True):
-        """Log security event"""
+        """Queue security event for the background writer"""
         try:
-            with self._get_db_connection() as conn:
-                conn.execute('''
-                    INSERT INTO audit_logs (event_type, user_id, username, client_ip, user_agent, details, success)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    event_type, 
-                    user_id, 
-                    username, 
-                    client_ip, 
-                    user_agent, 
-                    json.dumps(details) if details else None,
-                    success
-                ))
-                conn.commit()
-                
+            self._queue.put((
+                event_type, 
+                user_id, 
+                username, 
+                client_ip, 
+                user_agent, 
+                details or None,
+                success,
+                time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+            ))
+            
             logger.info(f"Audit: {event_type} - User: {username} - Success: {success}")
         except Exception as e:
             logger.error(f"Failed to log audit event: {e}")
+    
+    def flush(self):
+        """Block until every queued event has been written"""
+        self._queue.join()
+    
+    def _drain(self):
+        """Writer loop: collect up to BATCH_SIZE events or wait FLUSH_INTERVAL_SECONDS, then insert"""
+        while True:
+            rows = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_INTERVAL_SECONDS
+            
+            while len(rows) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            self._write_batch(rows)
+            for _ in rows:
+                self._queue.task_done()
+    
+    def _write_batch(self, rows: List[tuple]):
+        """Insert a batch of audit events in one transaction"""
+        try:
+            # details is serialised here, off the caller's thread
+            rows = [
+                row[:5] + (json.dumps(row[5]) if row[5] else None,) + row[6:]
+                for row in rows
+            ]
+            with self._get_db_connection() as conn, transaction(conn):
+                conn.executemany(self.INSERT_SQL, rows)
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} audit events: {e}")
 
 class AuthService:
     """Main authentication service"""
     
+    # Hot-path statements, kept as constants so the connection's statement cache reuses them
+    LOGIN_LOOKUP_SQL = '''
+        SELECT id, username, password_hash, salt, password_hash_b, salt_b, role, is_active 
+        FROM users WHERE username = ? OR email = ?
+    '''
+    
+    INSERT_SESSION_SQL = '''
+        INSERT INTO user_sessions (user_id, session_token, expires_at, expires_at_ts, client_ip, user_agent)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+    
+    VALIDATE_SESSION_SQL = '''
+        SELECT s.user_id, s.expires_at, s.expires_at_ts, s.created_at, u.username, u.role, u.is_active
+        FROM user_sessions s
+        JOIN users u ON s.user_id = u.id
+        WHERE s.session_token = ? AND s.is_active = 1
+    '''
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.rate_limiter = RateLimiter(db_path)
         self.audit_logger = AuditLogger(db_path)
         self._init_auth_tables()
+        
+        # session_token -> (cached_at, expires_at, user info) for validate_session
+        self._session_cache = {}
+        self._session_cache_lock = threading.Lock()
+        
+        # hmac(username, password) -> (verified_at, user_id, password_hash) for authenticate_user
+        self._auth_cache = OrderedDict()
+        self._auth_cache_lock = threading.Lock()
     
     def _init_auth_tables(self):
         """Initialize authentication tables"""
-        with self._get_db_connection() as conn:
+        with self._get_db_connection() as conn, transaction(conn):
             # Sessions table
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS user_sessions (
@@ -294,36 +508,97 @@ class AuthService:
                 )
             ''')
             
+            # Integer Unix expiry used by the hot paths; expires_at keeps the ISO form
+            columns = {row['name'] for row in conn.execute('PRAGMA table_info(user_sessions)')}
+            if 'expires_at_ts' not in columns:
+                conn.execute('ALTER TABLE user_sessions ADD COLUMN expires_at_ts INTEGER')
+                conn.execute('''
+                    UPDATE user_sessions
+                    SET expires_at_ts = CAST(strftime('%s', expires_at, 'utc') AS INTEGER)
+                ''')
+            
             # Create index for faster session lookups
             conn.execute('''
                 CREATE INDEX IF NOT EXISTS idx_session_token ON user_sessions(session_token)
             ''')
             
-            conn.commit()
+            # Covering index so validate_session never touches the table rows
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_session_lookup
+                ON user_sessions(session_token, is_active, user_id, expires_at_ts, expires_at, created_at)
+            ''')
+            
+            # Partial index: the expiry sweep only ever looks at active sessions
+            conn.execute('DROP INDEX IF EXISTS idx_user_sessions_expires_ts')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_active_expiry
+                ON user_sessions(expires_at_ts) WHERE is_active = 1
+            ''')
+            
+            # Bulk deactivation by user (password change, cleanup)
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_user_active ON user_sessions(user_id, is_active)
+            ''')
+            
+            self._init_binary_credentials(conn)
+    
+    def _init_binary_credentials(self, conn):
+        """Add raw BLOB copies of users.password_hash/salt so logins skip hex decoding"""
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(users)')}
+        if not columns:
+            return  # users table is created by db_init
+        
+        if 'password_hash_b' not in columns:
+            conn.execute('ALTER TABLE users ADD COLUMN password_hash_b BLOB')
+            conn.execute('ALTER TABLE users ADD COLUMN salt_b BLOB')
+        
+        # Writers that only set the hex columns (models.User) invalidate the binary copy
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_users_clear_binary_credentials
+            AFTER UPDATE OF password_hash, salt ON users
+            WHEN NEW.password_hash_b IS OLD.password_hash_b
+            BEGIN
+                UPDATE users SET password_hash_b = NULL, salt_b = NULL WHERE id = NEW.id;
+            END
+        ''')
+        
+        rows = conn.execute('''
+            SELECT id, password_hash, salt FROM users WHERE password_hash_b IS NULL
+        ''').fetchall()
+        conn.executemany('''
+            UPDATE users SET password_hash_b = ?, salt_b = ? WHERE id = ?
+        ''', [(bytes.fromhex(row['password_hash']), bytes.fromhex(row['salt']), row['id']) for row in rows])
+    
+    def _binary_credentials(self, user) -> tuple:
+        """Return (password_hash, salt) as bytes, backfilling rows written with hex only"""
+        if user['password_hash_b'] is not None:
+            return user['password_hash_b'], user['salt_b']
+        
+        stored_hash = bytes.fromhex(user['password_hash'])
+        salt = bytes.fromhex(user['salt'])
+        with self._get_db_connection() as conn:
+            conn.execute('''
+                UPDATE users SET password_hash_b = ?, salt_b = ?
+                WHERE id = ? AND password_hash = ?
+            ''', (stored_hash, salt, user['id'], user['password_hash']))
+        return stored_hash, salt
     
-    @contextmanager
     def _get_db_connection(self):
-        """Get database connection with proper error handling"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        finally:
-            if conn:
-                conn.close()
+        """Check out a connection from the shared pool"""
+        return pooled_connection(self.db_path)
     
     def _hash_password(self, password: str, salt: bytes = None) -> tuple:
         """Hash password with salt using PBKDF2"""
         if salt is None:
             salt = secrets.token_bytes(SecurityConfig.SALT_LENGTH)
         
-        password_hash = hashlib.pbkdf2_hmac(
+        password_hash = _hash_executor.submit(
+            hashlib.pbkdf2_hmac,
             SecurityConfig.HASH_ALGORITHM,
             password.encode('utf-8'),
             salt,
             SecurityConfig.HASH_ITERATIONS
-        )
+        ).result()
         
         return password_hash, salt
     
@@ -332,9 +607,44 @@ class AuthService:
         password_hash, _ = self._hash_password(password, salt)
         return hmac.compare_digest(password_hash, stored_hash)
     
+    def _auth_cache_key(self, username: str, password: str) -> bytes:
+        """Derive the credential cache key; plaintext passwords are never stored"""
+        message = username.encode('utf-8') + b'\0' + password.encode('utf-8')
+        return hmac.new(_AUTH_CACHE_PEPPER, message, 'sha256').digest()
+    
+    def _credentials_recently_verified(self, cache_key: bytes, user) -> bool:
+        """Check whether these credentials were verified against the same stored hash within the TTL"""
+        with self._auth_cache_lock:
+            cached = self._auth_cache.get(cache_key)
+            if not cached:
+                return False
+            
+            verified_at, user_id, password_hash = cached
+            if time.monotonic() - verified_at >= SecurityConfig.AUTH_CACHE_TTL_SECONDS:
+                del self._auth_cache[cache_key]
+                return False
+        
+        # A password change through any code path alters the stored hash
+        return user_id == user['id'] and password_hash == user['password_hash']
+    
+    def _remember_verified_credentials(self, cache_key: bytes, user):
+        """Record successfully verified credentials, evicting the oldest entry when full"""
+        with self._auth_cache_lock:
+            self._auth_cache[cache_key] = (time.monotonic(), user['id'], user['password_hash'])
+            self._auth_cache.move_to_end(cache_key)
+            while len(self._auth_cache) > SecurityConfig.AUTH_CACHE_MAX_ENTRIES:
+                self._auth_cache.popitem(last=False)
+    
+    def _forget_verified_credentials(self, user_id: int):
+        """Drop every cached credential belonging to user_id"""
+        with self._auth_cache_lock:
+            stale = [key for key, entry in self._auth_cache.items() if entry[1] == user_id]
+            for key in stale:
+                del self._auth_cache[key]
+    
     def _generate_session_token(self) -> str:
-        """Generate secure session token"""
-        return secrets.token_urlsafe(SecurityConfig.SESSION_TOKEN_LENGTH)
+        """Generate secure session token (SESSION_TOKEN_LENGTH random bytes, URL-safe base64)"""
+        return base64.urlsafe_b64encode(os.urandom(SecurityConfig.SESSION_TOKEN_LENGTH)).rstrip(b'=').decode('ascii')
     
     def authenticate_user(self, username: str, password: str, client_ip: str = None, user_agent: str = None) -> Optional[Dict]:
         """Authenticate user with username/password"""
@@ -346,54 +656,48 @@ class AuthService:
             return None
         
         try:
+            # Fetch the user row and release the connection before hashing
             with self._get_db_connection() as conn:
-                cursor = conn.execute('''
-                    SELECT id, username, password_hash, salt, role, is_active 
-                    FROM users WHERE username = ? OR email = ?
-                ''', (username, username))
+                cursor = conn.execute(self.LOGIN_LOOKUP_SQL, (username, username))
                 
                 user = cursor.fetchone()
-                
-                if not user:
-                    self.rate_limiter.record_attempt(username, success=False)
-                    self.audit_logger.log_event('login_failed', username=username, client_ip=client_ip,
-                                              user_agent=user_agent, details={'reason': 'user_not_found'}, success=False)
-                    return None
-                
-                if not user['is_active']:
-                    self.rate_limiter.record_attempt(username, success=False)
-                    self.audit_logger.log_event('login_failed', user_id=user['id'], username=username, 
-                                              client_ip=client_ip, user_agent=user_agent, 
-                                              details={'reason': 'account_disabled'}, success=False)
-                    return None
-                
-                # Verify password
-                stored_hash = user['password_hash']
-                salt = user['salt']
-                
-                if isinstance(stored_hash, str):
-                    stored_hash = bytes.fromhex(stored_hash)
-                if isinstance(salt, str):
-                    salt = bytes.fromhex(salt)
-                
-                if not self._verify_password(password, stored_hash, salt):
+            
+            if not user:
+                self.rate_limiter.record_attempt(username, success=False)
+                self.audit_logger.log_event('login_failed', username=username, client_ip=client_ip,
+                                          user_agent=user_agent, details={'reason': 'user_not_found'}, success=False)
+                return None
+            
+            if not user['is_active']:
+                self.rate_limiter.record_attempt(username, success=False)
+                self.audit_logger.log_event('login_failed', user_id=user['id'], username=username, 
+                                          client_ip=client_ip, user_agent=user_agent, 
+                                          details={'reason': 'account_disabled'}, success=False)
+                return None
+            
+            # Verify password (PBKDF2 is skipped for credentials verified moments ago)
+            cache_key = self._auth_cache_key(username, password)
+            if not self._credentials_recently_verified(cache_key, user):
+                if not self._verify_password(password, *self._binary_credentials(user)):
                     self.rate_limiter.record_attempt(username, success=False)
                     self.audit_logger.log_event('login_failed', user_id=user['id'], username=username, 
                                               client_ip=client_ip, user_agent=user_agent, 
                                               details={'reason': 'invalid_password'}, success=False)
                     return None
                 
-                # Success
-                self.rate_limiter.record_attempt(username, success=True)
-                self.audit_logger.log_event('login_success', user_id=user['id'], username=username, 
-                                          client_ip=client_ip, user_agent=user_agent, success=True)
-                
-                return {
-                    'id': user['id'],
-                    'username': user['username'],
-                    'role': user['role']
-                }
-                
+                self._remember_verified_credentials(cache_key, user)
+            
+            # Success
+            self.rate_limiter.record_attempt(username, success=True)
+            self.audit_logger.log_event('login_success', user_id=user['id'], username=username, 
+                                      client_ip=client_ip, user_agent=user_agent, success=True)
+            
+            return {
+                'id': user['id'],
+                'username': user['username'],
+                'role': user['role']
+            }
+            
         except Exception as e:
             logger.error(f"Authentication error: {e}")
             self.audit_logger.log_event('login_error', username=username, client_ip=client_ip,
@@ -405,14 +709,11 @@ class AuthService:
         try:
             session_token = self._generate_session_token()
             expires_hours = SecurityConfig.SESSION_REMEMBER_HOURS if remember else SecurityConfig.SESSION_EXPIRY_HOURS
-            expires_at = datetime.now() + timedelta(hours=expires_hours)
+            expires_at_ts = int(time.time()) + expires_hours * 3600
+            expires_at = datetime.fromtimestamp(expires_at_ts)
             
             with self._get_db_connection() as conn:
-                conn.execute('''
-                    INSERT INTO user_sessions (user_id, session_token, expires_at, client_ip, user_agent)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (user_id, session_token, expires_at.isoformat(), client_ip, user_agent))
-                conn.commit()
+                conn.execute(self.INSERT_SESSION_SQL, (user_id, session_token, expires_at.isoformat(), expires_at_ts, client_ip, user_agent))
             
             self.audit_logger.log_event('session_created', user_id=user_id, client_ip=client_ip,
                                       user_agent=user_agent, details={'remember': remember}, success=True)
@@ -428,14 +729,16 @@ class AuthService:
         if not session_token:
             return None
         
+        cached = self._session_cache.get(session_token)
+        if cached:
+            cached_at, expires_at_ts, user_info = cached
+            if time.monotonic() - cached_at < SecurityConfig.SESSION_CACHE_TTL_SECONDS and expires_at_ts >= time.time():
+                return dict(user_info)
+            self._invalidate_cached_session(session_token)
+        
         try:
             with self._get_db_connection() as conn:
-                cursor = conn.execute('''
-                    SELECT s.*, u.username, u.role, u.is_active
-                    FROM user_sessions s
-                    JOIN users u ON s.user_id = u.id
-                    WHERE s.session_token = ? AND s.is_active = 1
-                ''', (session_token,))
+                cursor = conn.execute(self.VALIDATE_SESSION_SQL, (session_token,))
                 
                 session = cursor.fetchone()
                 
@@ -443,23 +746,25 @@ class AuthService:
                     return None
                 
                 # Check if session expired
-                expires_at = datetime.fromisoformat(session['expires_at'])
-                if expires_at < datetime.now():
-                    # Deactivate expired session
-                    conn.execute('''
-                        UPDATE user_sessions SET is_active = 0 WHERE session_token = ?
-                    ''', (session_token,))
-                    conn.commit()
+                expires_at_ts = session['expires_at_ts']
+                if expires_at_ts < time.time():
+                    # Deactivate expired session; only the request that flips the flag logs it
+                    deactivated = conn.execute('''
+                        UPDATE user_sessions SET is_active = 0
+                        WHERE session_token = ? AND is_active = 1
+                        RETURNING user_id
+                    ''', (session_token,)).fetchone()
                     
-                    self.audit_logger.log_event('session_expired', user_id=session['user_id'], 
-                                              details={'session_token': session_token[:16] + '...'}, success=False)
+                    if deactivated:
+                        self.audit_logger.log_event('session_expired', user_id=deactivated['user_id'], 
+                                                  details={'session_token': session_token[:16] + '...'}, success=False)
                     return None
                 
                 # Check if user is still active
                 if not session['is_active']:
                     return None
                 
-                return {
+                user_info = {
                     'id': session['user_id'],
                     'username': session['username'],
                     'role': session['role'],
@@ -467,15 +772,36 @@ class AuthService:
                     'session_expires': session['expires_at']
                 }
                 
+            with self._session_cache_lock:
+                if len(self._session_cache) >= SecurityConfig.SESSION_CACHE_MAX_ENTRIES:
+                    self._session_cache.clear()
+                self._session_cache[session_token] = (time.monotonic(), expires_at_ts, user_info)
+            
+            return dict(user_info)
+                
         except Exception as e:
             logger.error(f"Session validation error: {e}")
             return None
     
+    def _invalidate_cached_session(self, session_token: str):
+        """Drop a session token from the validation cache"""
+        with self._session_cache_lock:
+            self._session_cache.pop(session_token, None)
+    
+    def _invalidate_cached_user_sessions(self, user_id: int):
+        """Drop every cached session belonging to user_id"""
+        with self._session_cache_lock:
+            stale = [token for token, entry in self._session_cache.items() if entry[2]['id'] == user_id]
+            for token in stale:
+                del self._session_cache[token]
+    
     def logout_session(self, session_token: str) -> bool:
         """Logout session (deactivate)"""
         if not session_token:
             return False
         
+        self._invalidate_cached_session(session_token)
+        
         try:
             with self._get_db_connection() as conn:
                 cursor = conn.execute('''
@@ -487,7 +813,6 @@ class AuthService:
                     conn.execute('''
                         UPDATE user_sessions SET is_active = 0 WHERE session_token = ?
                     ''', (session_token,))
-                    conn.commit()
                     
                     self.audit_logger.log_event('logout', user_id=session['user_id'], 
                                               details={'session_token': session_token[:16] + '...'}, success=True)
@@ -501,20 +826,31 @@ class AuthService:
     
     def cleanup_expired_sessions(self):
         """Clean up expired sessions (should be run periodically)"""
+        self.audit_logger.flush()
+        
         try:
-            with self._get_db_connection() as conn:
-                current_time = datetime.now().isoformat()
+            with self._get_db_connection() as conn, transaction(conn):
+                current_time = int(time.time())
                 cursor = conn.execute('''
                     UPDATE user_sessions 
                     SET is_active = 0 
-                    WHERE expires_at < ? AND is_active = 1
+                    WHERE expires_at_ts < ? AND is_active = 1
                 ''', (current_time,))
                 
                 cleaned_count = cursor.rowcount
-                conn.commit()
                 
-                if cleaned_count > 0:
-                    logger.info(f"Cleaned up {cleaned_count} expired sessions")
+                # Purge sessions that expired long ago so the table tracks live history only
+                cursor = conn.execute('''
+                    DELETE FROM user_sessions
+                    WHERE is_active = 0 AND expires_at_ts < ?
+                ''', (current_time - SecurityConfig.SESSION_RETENTION_DAYS * 86400,))
+                
+                purged_count = cursor.rowcount
+            
+            if cleaned_count > 0:
+                logger.info(f"Cleaned up {cleaned_count} expired sessions")
+            if purged_count > 0:
+                logger.info(f"Purged {purged_count} sessions older than {SecurityConfig.SESSION_RETENTION_DAYS} days")
                 
         except Exception as e:
             logger.error(f"Session cleanup error: {e}")
@@ -531,48 +867,47 @@ class AuthService:
             }
         
         try:
+            # Fetch the user row and release the connection before hashing
             with self._get_db_connection() as conn:
-                # Get current user
                 cursor = conn.execute('''
-                    SELECT username, password_hash, salt FROM users WHERE id = ?
+                    SELECT id, username, password_hash, salt, password_hash_b, salt_b FROM users WHERE id = ?
                 ''', (user_id,))
                 user = cursor.fetchone()
-                
-                if not user:
-                    return {'success': False, 'error': 'user_not_found'}
-                
-                # Verify current password
-                stored_hash = bytes.fromhex(user['password_hash']) if isinstance(user['password_hash'], str) else user['password_hash']
-                salt = bytes.fromhex(user['salt']) if isinstance(user['salt'], str) else user['salt']
-                
-                if not self._verify_password(current_password, stored_hash, salt):
-                    self.audit_logger.log_event('password_change_failed', user_id=user_id, 
-                                              username=user['username'], client_ip=client_ip,
-                                              details={'reason': 'invalid_current_password'}, success=False)
-                    return {'success': False, 'error': 'invalid_current_password'}
-                
-                # Hash new password
-                new_hash, new_salt = self._hash_password(new_password)
-                
+            
+            if not user:
+                return {'success': False, 'error': 'user_not_found'}
+            
+            # Verify current password
+            if not self._verify_password(current_password, *self._binary_credentials(user)):
+                self.audit_logger.log_event('password_change_failed', user_id=user_id, 
+                                          username=user['username'], client_ip=client_ip,
+                                          details={'reason': 'invalid_current_password'}, success=False)
+                return {'success': False, 'error': 'invalid_current_password'}
+            
+            # Hash new password
+            new_hash, new_salt = self._hash_password(new_password)
+            
+            with self._get_db_connection() as conn, transaction(conn):
                 # Update password
                 conn.execute('''
                     UPDATE users 
-                    SET password_hash = ?, salt = ?, password_changed_at = CURRENT_TIMESTAMP
+                    SET password_hash = ?, salt = ?, password_hash_b = ?, salt_b = ?,
+                        password_changed_at = CURRENT_TIMESTAMP
                     WHERE id = ?
-                ''', (new_hash.hex(), new_salt.hex(), user_id))
-                conn.commit()
+                ''', (new_hash.hex(), new_salt.hex(), new_hash, new_salt, user_id))
                 
                 # Invalidate all existing sessions for security
                 conn.execute('''
                     UPDATE user_sessions SET is_active = 0 WHERE user_id = ?
                 ''', (user_id,))
-                conn.commit()
-                
-                self.audit_logger.log_event('password_changed', user_id=user_id, 
-                                          username=user['username'], client_ip=client_ip, success=True)
-                
-                return {'success': True}
-                
+            self._invalidate_cached_user_sessions(user_id)
+            self._forget_verified_credentials(user_id)
+            
+            self.audit_logger.log_event('password_changed', user_id=user_id, 
+                                      username=user['username'], client_ip=client_ip, success=True)
+            
+            return {'success': True}
+            
         except Exception as e:
             logger.error(f"Password change error: {e}")
             return {'success': False, 'error': 'internal_error'}
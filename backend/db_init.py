@@ -8,18 +8,47 @@ import sqlite3
 import hashlib
 import secrets
 import os
+import time
 from datetime import datetime
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'matrica.db')
 
+_connection = None
+_connection_path = None
+
+def get_connection():
+    """Return the bootstrap connection, opening it once so every step reuses it"""
+    global _connection, _connection_path
+    if _connection is None or _connection_path != DB_PATH:
+        close_connection()
+        _connection = sqlite3.connect(DB_PATH)
+        _connection_path = DB_PATH
+    return _connection
+
+def close_connection():
+    """Close the shared bootstrap connection"""
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
 def create_tables():
     """Create all database tables with proper constraints and indexes"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
     
     # Enable foreign key constraints
     cursor.execute("PRAGMA foreign_keys = ON")
     
+    # WAL lets readers run alongside the single writer; the mode persists in the database file
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    
+    # Run the whole schema in one explicit transaction so bootstrap pays a
+    # single commit instead of one implicit commit per CREATE statement
+    cursor.execute("BEGIN")
+    
     # Users table (employees and admin)
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -28,6 +57,8 @@ def create_tables():
             email TEXT UNIQUE NOT NULL,
             password_hash TEXT NOT NULL,
             salt TEXT NOT NULL,
+            password_hash_b BLOB,
+            salt_b BLOB,
             first_name TEXT NOT NULL,
             last_name TEXT NOT NULL,
             role TEXT CHECK(role IN ('admin', 'employee')) DEFAULT 'employee',
@@ -66,6 +97,7 @@ def create_tables():
             user_id INTEGER NOT NULL,
             session_token TEXT UNIQUE NOT NULL,
             expires_at DATETIME NOT NULL,
+            expires_at_ts INTEGER,
             is_active BOOLEAN DEFAULT 1,
             client_ip TEXT,
             user_agent TEXT,
@@ -260,24 +292,35 @@ def create_tables():
             resource_id TEXT,
             details TEXT,
             ip_address TEXT,
+            ip_v4 INTEGER,
             user_agent TEXT,
+            user_agent_id INTEGER,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL
+            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL,
+            FOREIGN KEY (user_agent_id) REFERENCES user_agents (id)
         )
     ''')
     
-    # Rate limiting table
+    # Distinct user-agent strings, referenced by id from audit_log
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS rate_limits (
+        CREATE TABLE IF NOT EXISTS user_agents (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            ip_address TEXT NOT NULL,
-            endpoint TEXT NOT NULL,
-            requests INTEGER DEFAULT 1,
-            window_start DATETIME DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(ip_address, endpoint)
+            ua TEXT UNIQUE NOT NULL
         )
     ''')
     
+    # IPv4 clients are stored packed in ip_v4; ip_address only keeps other forms.
+    # New rows reference user_agents through user_agent_id instead of repeating the string.
+    cursor.execute("PRAGMA table_info(audit_log)")
+    audit_columns = {row[1] for row in cursor.fetchall()}
+    if 'ip_v4' not in audit_columns:
+        cursor.execute("ALTER TABLE audit_log ADD COLUMN ip_v4 INTEGER")
+    if 'user_agent_id' not in audit_columns:
+        cursor.execute("ALTER TABLE audit_log ADD COLUMN user_agent_id INTEGER REFERENCES user_agents (id)")
+    
+    # Rate limiting is kept in memory (models.RateLimit); drop the unused per-endpoint table
+    cursor.execute("DROP TABLE IF EXISTS rate_limits")
+    
     # Jobs table for careers management
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS jobs (
@@ -299,13 +342,28 @@ def create_tables():
             applications_count INTEGER DEFAULT 0,
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            published_at DATETIME,
+            published_at INTEGER,
             FOREIGN KEY (posted_by) REFERENCES users (id) ON DELETE SET NULL
         )
     ''')
     
-    # Create indexes for better performance
-    cursor.executescript('''
+    # jobs.published_at holds Unix seconds; convert rows older versions wrote as local ISO text
+    cursor.execute('''
+        UPDATE jobs SET published_at = CAST(strftime('%s', published_at, 'utc') AS INTEGER)
+        WHERE typeof(published_at) = 'text'
+    ''')
+    
+    conn.commit()
+    print("✓ Database tables created successfully")
+
+def create_indexes():
+    """Create indexes once seeding is done, so the seed inserts skip index maintenance"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    
+    # Create indexes for better performance (executescript would commit early)
+    for statement in '''
         CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
         CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
         CREATE INDEX IF NOT EXISTS idx_users_employee_id ON users(employee_id);
@@ -318,26 +376,35 @@ def create_tables():
         CREATE INDEX IF NOT EXISTS idx_security_audit_time ON security_audit_log(created_at);
         CREATE INDEX IF NOT EXISTS idx_security_audit_event ON security_audit_log(event_type);
         CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks(project_id);
-        CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks(assigned_to);
+        CREATE INDEX IF NOT EXISTS idx_tasks_assigned_due ON tasks(assigned_to, due_date, priority DESC);
         CREATE INDEX IF NOT EXISTS idx_tickets_assignee_id ON tickets(assignee_id);
         CREATE INDEX IF NOT EXISTS idx_attendance_user_id ON attendance(user_id);
         CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance(date);
         CREATE INDEX IF NOT EXISTS idx_leave_requests_user_id ON leave_requests(user_id);
         CREATE INDEX IF NOT EXISTS idx_blogs_author_id ON blogs(author_id);
-        CREATE INDEX IF NOT EXISTS idx_blogs_type ON blogs(type);
-        CREATE INDEX IF NOT EXISTS idx_blogs_status ON blogs(status);
+        CREATE INDEX IF NOT EXISTS idx_blogs_status_published_at ON blogs(status, published_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_blogs_status_type_published_at ON blogs(status, type, published_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_blogs_type_created ON blogs(type, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_blogs_created_at ON blogs(created_at DESC);
         CREATE INDEX IF NOT EXISTS idx_audit_log_user_id ON audit_log(user_id);
         CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log(created_at);
-        CREATE INDEX IF NOT EXISTS idx_jobs_department ON jobs(department);
-        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
-        CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
-        CREATE INDEX IF NOT EXISTS idx_jobs_job_type ON jobs(job_type);
-        CREATE INDEX IF NOT EXISTS idx_jobs_experience_level ON jobs(experience_level);
-    ''')
+        CREATE INDEX IF NOT EXISTS idx_audit_log_ip_v4 ON audit_log(ip_v4);
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_published_at ON jobs(status, published_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_jobs_public_filter ON jobs(status, department, location, job_type, experience_level);
+        DROP INDEX IF EXISTS idx_jobs_department;
+        DROP INDEX IF EXISTS idx_jobs_status;
+        DROP INDEX IF EXISTS idx_jobs_location;
+        DROP INDEX IF EXISTS idx_jobs_job_type;
+        DROP INDEX IF EXISTS idx_jobs_experience_level;
+        DROP INDEX IF EXISTS idx_tasks_assigned_to;
+        DROP INDEX IF EXISTS idx_blogs_type;
+        DROP INDEX IF EXISTS idx_blogs_status;
+        ANALYZE
+    '''.split(';'):
+        cursor.execute(statement)
     
     conn.commit()
-    conn.close()
-    print("✓ Database tables created successfully")
+    print("✓ Database indexes created successfully")
 
 def hash_password(password, salt=None):
     """Hash password using PBKDF2 with salt"""
@@ -356,14 +423,13 @@ def hash_password(password, salt=None):
 
 def create_admin_user():
     """Create default admin user with specified credentials"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
     
     # Check if admin user already exists
     cursor.execute("SELECT id FROM users WHERE username = 'psychy'")
     if cursor.fetchone():
         print("✓ Admin user already exists")
-        conn.close()
         return
     
     # Create admin user
@@ -400,36 +466,37 @@ def create_admin_user():
     ))
     
     conn.commit()
-    conn.close()
     print("✓ Admin user created successfully")
     print("  Username: psychy")
     print("  Password: Ka05ml@2120")
 
 def insert_sample_data():
     """Insert sample data for demonstration"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
     
-    # Insert sample employee
-    password_hash, salt = hash_password("employee123")
-    cursor.execute('''
-        INSERT OR IGNORE INTO users (
-            username, email, password_hash, salt, first_name, last_name, 
-            role, employee_id, department, designation, is_active
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'john.doe',
-        'john.doe@matricanetworks.com',
-        password_hash,
-        salt,
-        'John',
-        'Doe',
-        'employee',
-        'EMP002',
-        'Cybersecurity',
-        'Security Analyst',
-        1
-    ))
+    # Insert sample employee (skip the PBKDF2 hash entirely when it already exists)
+    cursor.execute("SELECT 1 FROM users WHERE username = 'john.doe'")
+    if not cursor.fetchone():
+        password_hash, salt = hash_password("employee123")
+        cursor.execute('''
+            INSERT OR IGNORE INTO users (
+                username, email, password_hash, salt, first_name, last_name, 
+                role, employee_id, department, designation, is_active
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            'john.doe',
+            'john.doe@matricanetworks.com',
+            password_hash,
+            salt,
+            'John',
+            'Doe',
+            'employee',
+            'EMP002',
+            'Cybersecurity',
+            'Security Analyst',
+            1
+        ))
     
     # Insert sample project
     cursor.execute('''
@@ -445,121 +512,108 @@ def insert_sample_data():
         'TechCorp Inc.'
     ))
     
-    # Insert sample blog entries
-    cursor.execute('''
-        INSERT OR IGNORE INTO blogs (
-            title, type, content, excerpt, author_id, status, published_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'The Future of Cybersecurity',
-        'blog',
-        'Lorem ipsum dolor sit amet, consectetur adipiscing elit...',
-        'Exploring emerging trends in cybersecurity...',
-        1,  # admin user
-        'published',
-        datetime.now()
-    ))
-    
-    cursor.execute('''
-        INSERT OR IGNORE INTO blogs (
-            title, type, content, excerpt, author_id, status, published_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'Q4 Security Update',
-        'post',
-        'Our quarterly security update includes important information...',
-        'Latest security updates and patches...',
-        1,  # admin user
-        'published',
-        datetime.now()
-    ))
-    
-    cursor.execute('''
-        INSERT OR IGNORE INTO blogs (
+    # Insert sample blog entries and job postings, one executemany per table.
+    # The tables have no unique key to IGNORE on, so rows are matched by title to keep reruns idempotent.
+    now = datetime.now()
+    published_ts = int(time.time())  # jobs.published_at is Unix seconds
+    blog_rows = [
+        (
+            'The Future of Cybersecurity',
+            'blog',
+            'Lorem ipsum dolor sit amet, consectetur adipiscing elit...',
+            'Exploring emerging trends in cybersecurity...',
+            1,  # admin user
+            'published',
+            now
+        ),
+        (
+            'Q4 Security Update',
+            'post',
+            'Our quarterly security update includes important information...',
+            'Latest security updates and patches...',
+            1,  # admin user
+            'published',
+            now
+        ),
+        (
+            'Banking Sector Penetration Test',
+            'case',
+            'Case study of our recent penetration testing engagement...',
+            'How we helped a major bank improve their security posture...',
+            1,  # admin user
+            'published',
+            now
+        )
+    ]
+    cursor.executemany('''
+        INSERT INTO blogs (
             title, type, content, excerpt, author_id, status, published_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'Banking Sector Penetration Test',
-        'case',
-        'Case study of our recent penetration testing engagement...',
-        'How we helped a major bank improve their security posture...',
-        1,  # admin user
-        'published',
-        datetime.now()
-    ))
-    
-    # Insert sample job postings
-    cursor.execute('''
-        INSERT OR IGNORE INTO jobs (
-            title, department, location, job_type, experience_level, description, 
-            requirements, responsibilities, benefits, salary_min, salary_max, 
-            status, posted_by, published_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'Senior Cybersecurity Analyst',
-        'Cybersecurity',
-        'San Francisco, CA / Remote',
-        'full-time',
-        'senior',
-        'Join our elite cybersecurity team to protect enterprise clients from advanced persistent threats.',
-        'Bachelor\'s degree in Computer Science or Cybersecurity, CISSP certification preferred, 5+ years experience in SOC operations, expertise in SIEM tools',
-        'Monitor security events, conduct threat hunting, perform incident response, develop security policies, mentor junior analysts',
-        'Competitive salary, health insurance, retirement plan, professional development budget, flexible work arrangements',
-        120000,
-        150000,
-        'published',
-        1,
-        datetime.now()
-    ))
-    
-    cursor.execute('''
-        INSERT OR IGNORE INTO jobs (
-            title, department, location, job_type, experience_level, description, 
-            requirements, responsibilities, benefits, salary_min, salary_max, 
-            status, posted_by, published_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'Penetration Tester',
-        'Cybersecurity',
-        'New York, NY / Remote',
-        'full-time',
-        'mid',
-        'Conduct comprehensive penetration testing engagements for Fortune 500 clients.',
-        'OSCP, CEH, or equivalent certification, 3+ years penetration testing experience, knowledge of web application security',
-        'Perform network and application penetration tests, write detailed reports, present findings to clients, develop custom exploits',
-        'Competitive salary, health insurance, retirement plan, conference attendance, certification reimbursement',
-        95000,
-        120000,
-        'published',
-        1,
-        datetime.now()
-    ))
-    
-    cursor.execute('''
-        INSERT OR IGNORE INTO jobs (
+        )
+        SELECT ?, ?, ?, ?, ?, ?, ?
+        WHERE NOT EXISTS (SELECT 1 FROM blogs WHERE title = ?1)
+    ''', blog_rows)
+    
+    job_rows = [
+        (
+            'Senior Cybersecurity Analyst',
+            'Cybersecurity',
+            'San Francisco, CA / Remote',
+            'full-time',
+            'senior',
+            'Join our elite cybersecurity team to protect enterprise clients from advanced persistent threats.',
+            'Bachelor\'s degree in Computer Science or Cybersecurity, CISSP certification preferred, 5+ years experience in SOC operations, expertise in SIEM tools',
+            'Monitor security events, conduct threat hunting, perform incident response, develop security policies, mentor junior analysts',
+            'Competitive salary, health insurance, retirement plan, professional development budget, flexible work arrangements',
+            120000,
+            150000,
+            'published',
+            1,
+            published_ts
+        ),
+        (
+            'Penetration Tester',
+            'Cybersecurity',
+            'New York, NY / Remote',
+            'full-time',
+            'mid',
+            'Conduct comprehensive penetration testing engagements for Fortune 500 clients.',
+            'OSCP, CEH, or equivalent certification, 3+ years penetration testing experience, knowledge of web application security',
+            'Perform network and application penetration tests, write detailed reports, present findings to clients, develop custom exploits',
+            'Competitive salary, health insurance, retirement plan, conference attendance, certification reimbursement',
+            95000,
+            120000,
+            'published',
+            1,
+            published_ts
+        ),
+        (
+            'Junior Security Engineer',
+            'Engineering',
+            'Austin, TX / Hybrid',
+            'full-time',
+            'entry',
+            'Entry-level position for passionate cybersecurity graduates to start their career.',
+            'Bachelor\'s degree in Computer Science, Cybersecurity, or related field, Security+ certification preferred, internship experience in security',
+            'Assist with security assessments, maintain security tools, document procedures, participate in incident response',
+            'Competitive salary, comprehensive training program, mentorship, health insurance, career development opportunities',
+            65000,
+            80000,
+            'published',
+            1,
+            published_ts
+        )
+    ]
+    cursor.executemany('''
+        INSERT INTO jobs (
             title, department, location, job_type, experience_level, description, 
             requirements, responsibilities, benefits, salary_min, salary_max, 
             status, posted_by, published_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
-        'Junior Security Engineer',
-        'Engineering',
-        'Austin, TX / Hybrid',
-        'full-time',
-        'entry',
-        'Entry-level position for passionate cybersecurity graduates to start their career.',
-        'Bachelor\'s degree in Computer Science, Cybersecurity, or related field, Security+ certification preferred, internship experience in security',
-        'Assist with security assessments, maintain security tools, document procedures, participate in incident response',
-        'Competitive salary, comprehensive training program, mentorship, health insurance, career development opportunities',
-        65000,
-        80000,
-        'published',
-        1,
-        datetime.now()
-    ))
+        )
+        SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE title = ?1)
+    ''', job_rows)
     
     conn.commit()
-    conn.close()
     print("✓ Sample data inserted successfully")
 
 def main():
@@ -576,6 +630,11 @@ def main():
     # Insert sample data
     insert_sample_data()
     
+    # Indexes last: bulk inserts into unindexed tables are cheaper
+    create_indexes()
+    
+    close_connection()
+    
     print("\n🎉 Database initialization completed successfully!")
     print("\nYou can now start the server with: python backend/server.py")
 
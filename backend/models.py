@@ -6,57 +6,276 @@ Clean, secure data access layer with prepared statements
 
 import sqlite3
 import hashlib
+import hmac
 import secrets
+import socket
 import os
+import time
+import atexit
+import queue
+import logging
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'matrica.db')
 
+logger = logging.getLogger(__name__)
+
 class Database:
     """Database connection manager with security features"""
     
+    # One warm connection per long-lived thread (the background writers)
+    _local = threading.local()
+    # Prepared statements kept per connection, keyed by exact SQL text
+    STATEMENT_CACHE_SIZE = 256
+    
+    # Idle connections shared across threads, keyed by path. The WSGI server runs every request on a
+    # fresh thread, so request-path connections must outlive their thread to be reused.
+    POOL_SIZE = 8
+    _idle = {}
+    _idle_lock = threading.Lock()
+    
     @staticmethod
     def get_connection():
         """Get database connection with security settings"""
-        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                               cached_statements=Database.STATEMENT_CACHE_SIZE)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
+        Database.configure_connection(conn)
+        return conn
+    
+    @staticmethod
+    def configure_connection(conn: sqlite3.Connection):
+        """Apply the per-connection PRAGMAs (journal_mode is persistent, the rest are not)"""
         conn.execute("PRAGMA foreign_keys = ON")  # Enable FK constraints
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -20000")
+        conn.execute("PRAGMA mmap_size = 268435456")
+    
+    @staticmethod
+    def get_pooled_connection():
+        """Get this thread's reusable connection, reopening it if DB_PATH changed"""
+        local = Database._local
+        conn = getattr(local, 'conn', None)
+        if conn is None or local.path != DB_PATH:
+            if conn is not None:
+                conn.close()
+            conn = Database.get_connection()
+            local.conn, local.path = conn, DB_PATH
         return conn
     
+    @staticmethod
+    @contextmanager
+    def connection():
+        """Check out a warm connection from the shared pool, opening one if none is idle"""
+        path = DB_PATH
+        with Database._idle_lock:
+            idle = Database._idle.get(path)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            conn = Database.get_connection()
+        
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with Database._idle_lock:
+                idle = Database._idle.setdefault(path, [])
+                if len(idle) < Database.POOL_SIZE:
+                    idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+    
+    @staticmethod
+    def close_idle_connections():
+        """Close every pooled connection that is not checked out"""
+        with Database._idle_lock:
+            idle, Database._idle = Database._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+    
+    @staticmethod
+    def insert_many(query: str, params_list: List[tuple]) -> List[int]:
+        """Run an INSERT once per parameter tuple inside one transaction; returns the new row ids"""
+        with Database.connection() as conn, conn:
+            return [conn.execute(query, params).lastrowid for params in params_list]
+    
     @staticmethod
     def execute_query(query: str, params: tuple = None, fetch: str = None):
         """Safely execute query with prepared statements"""
-        conn = Database.get_connection()
-        cursor = conn.cursor()
+        with Database.connection() as conn:
+            cursor = conn.cursor()
+            # Plain tuples: zipping them into dicts is cheaper than building sqlite3.Row objects first
+            cursor.row_factory = None
+            
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                if fetch == 'one':
+                    result = cursor.fetchone()
+                    if conn.in_transaction:  # write ... RETURNING
+                        conn.commit()
+                    return Database._rows_to_dicts(cursor, (result,))[0] if result else None
+                elif fetch == 'all':
+                    results = cursor.fetchall()
+                    if conn.in_transaction:  # write ... RETURNING
+                        conn.commit()
+                    return Database._rows_to_dicts(cursor, results)
+                elif fetch == 'lastrowid':
+                    conn.commit()
+                    return cursor.lastrowid
+                else:
+                    conn.commit()
+                    return cursor.rowcount
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
+    
+    @staticmethod
+    def _rows_to_dicts(cursor: sqlite3.Cursor, rows) -> List[Dict]:
+        """Turn tuple rows into dicts keyed by the cursor's column names"""
+        names = [column[0] for column in cursor.description]
+        if len(set(names)) < len(names):
+            # Keep the first of duplicate column names, as dict(sqlite3.Row) does
+            names.reverse()
+            return [dict(zip(names, row[::-1])) for row in rows]
+        return [dict(zip(names, row)) for row in rows]
+
+# Registered first so it runs after the flush handlers below (atexit is LIFO)
+atexit.register(Database.close_idle_connections)
+
+class QueryCache:
+    """Bounded LRU of query results that expire after a TTL and are dropped on any write"""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any, ttl: int, loader) -> Any:
+        """Return the cached value for key, reloading it once ttl seconds have passed"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+            version = self._version
         
-        try:
-            if params:
-                cursor.execute(query, params)
+        value = loader()
+        with self._lock:
+            if version != self._version:
+                # A write happened while loading; don't cache a possibly stale result
+                return value
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+    
+    def invalidate(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+class TokenBucket:
+    """Per-key token buckets; the least recently used key is forgotten once max_keys are tracked"""
+    
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, last_refill), least recently used first
+        self._lock = threading.Lock()
+    
+    def take(self, key: Any, capacity: float, refill_per_second: float) -> bool:
+        """Spend one token from key's bucket; False when it is empty"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    # Only new keys evict, one O(1) pop each
+                    self._buckets.popitem(last=False)
+                tokens = capacity
             else:
-                cursor.execute(query)
+                self._buckets.move_to_end(key)
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+                if tokens < 1:
+                    return False
             
-            if fetch == 'one':
-                result = cursor.fetchone()
-                return dict(result) if result else None
-            elif fetch == 'all':
-                results = cursor.fetchall()
-                return [dict(row) for row in results]
-            elif fetch == 'lastrowid':
-                conn.commit()
-                return cursor.lastrowid
-            else:
-                conn.commit()
-                return cursor.rowcount
+            self._buckets[key] = (tokens - 1, now)
+            return True
+
+class StampBuffer:
+    """Coalesces per-row timestamp writes and saves them in one batch from a background thread"""
+    
+    def __init__(self, sql: str, interval: float, name: str):
+        self.sql = sql
+        self.interval = interval
+        self.name = name
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flusher = None
+        atexit.register(self.flush)
+    
+    def record(self, row_id: Any, value: Any):
+        """Remember the latest value for row_id; persisted by the background flusher"""
+        with self._lock:
+            self._pending[row_id] = value
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_forever, name=self.name, daemon=True)
+                self._flusher.start()
+    
+    def _flush_forever(self):
+        """Background loop writing buffered values"""
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+    
+    def flush(self):
+        """Write buffered values with a single executemany"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        
+        if not pending:
+            return
+        
+        try:
+            with Database.connection() as conn, conn:
+                conn.executemany(self.sql, [(value, row_id) for row_id, value in pending.items()])
         except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+            logger.error("Failed to flush %s: %s", self.name, e)
+            with self._lock:
+                # Keep anything recorded since, which is newer
+                pending.update(self._pending)
+                self._pending = pending
 
 class User:
     """User model with authentication methods"""
     
+    # last_login is written in batches instead of a commit per login
+    _last_login = StampBuffer("UPDATE users SET last_login = ? WHERE id = ?", 2, 'user-last-login')
+    
+    # Every column except the password hash/salt (and their BLOB copies kept by auth.py)
+    SAFE_COLUMNS = (
+        "id, username, email, first_name, last_name, role, employee_id, department, "
+        "designation, phone, date_joined, is_active, last_login, created_at, updated_at"
+    )
+    
     @staticmethod
     def hash_password(password: str, salt: str = None) -> tuple:
         """Hash password with PBKDF2 and salt"""
@@ -84,14 +303,10 @@ class User:
         if not user:
             return None
         
-        # Verify password
+        # Verify password (constant-time; hex digests are ASCII so compare_digest accepts them)
         password_hash, _ = User.hash_password(password, user['salt'])
-        if password_hash == user['password_hash']:
-            # Update last login
-            Database.execute_query(
-                "UPDATE users SET last_login = ? WHERE id = ?",
-                (datetime.now(), user['id'])
-            )
+        if hmac.compare_digest(password_hash, user['password_hash']):
+            User._last_login.record(user['id'], datetime.now())
             return user
         
         return None
@@ -100,7 +315,7 @@ class User:
     def get_by_id(user_id: int) -> Optional[Dict]:
         """Get user by ID"""
         return Database.execute_query(
-            "SELECT * FROM users WHERE id = ?",
+            f"SELECT {User.SAFE_COLUMNS} FROM users WHERE id = ?",
             (user_id,),
             'one'
         )
@@ -109,64 +324,83 @@ class User:
     def get_all() -> List[Dict]:
         """Get all users"""
         return Database.execute_query(
-            "SELECT * FROM users ORDER BY created_at DESC",
+            f"SELECT {User.SAFE_COLUMNS} FROM users ORDER BY created_at DESC",
             fetch='all'
         )
     
+    INSERT_SQL = '''
+        INSERT INTO users (
+            username, email, password_hash, salt, first_name, last_name,
+            role, employee_id, department, designation, phone
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
     @staticmethod
-    def create(data: Dict) -> int:
-        """Create new user"""
-        password_hash, salt = User.hash_password(data['password'])
-        
-        return Database.execute_query('''
-            INSERT INTO users (
-                username, email, password_hash, salt, first_name, last_name,
-                role, employee_id, department, designation, phone
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    def _insert_params(data: Dict, password_hash: str, salt: str) -> tuple:
+        """Bind a user dict to INSERT_SQL"""
+        return (
             data['username'], data['email'], password_hash, salt,
             data['first_name'], data['last_name'], data.get('role', 'employee'),
             data.get('employee_id'), data.get('department'), 
             data.get('designation'), data.get('phone')
-        ), 'lastrowid')
+        )
+    
+    @staticmethod
+    def create(data: Dict) -> int:
+        """Create new user"""
+        password_hash, salt = User.hash_password(data['password'])
+        return Database.execute_query(User.INSERT_SQL, User._insert_params(data, password_hash, salt), 'lastrowid')
+    
+    @staticmethod
+    def create_many(rows: List[Dict]) -> List[int]:
+        """Create several users in one transaction; passwords are hashed in parallel"""
+        if not rows:
+            return []
+        # pbkdf2_hmac releases the GIL, so threads hash on separate cores
+        with ThreadPoolExecutor(max_workers=min(len(rows), os.cpu_count() or 1)) as pool:
+            credentials = list(pool.map(User.hash_password, [data['password'] for data in rows]))
+        return Database.insert_many(User.INSERT_SQL, [
+            User._insert_params(data, password_hash, salt) for data, (password_hash, salt) in zip(rows, credentials)
+        ])
+    
+    UPDATE_FIELDS = ('first_name', 'last_name', 'email', 'department', 'designation', 'phone')
+    # Fixed statements for every partial update (see Job.UPDATE_SQL), so they stay in the statement cache.
+    # Credentials get their own statement: assigning password_hash/salt fires the trigger that clears
+    # the binary copies, which profile edits must not do.
+    _PROFILE_SET_SQL = ", ".join(f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in UPDATE_FIELDS)
+    UPDATE_SQL = "UPDATE users SET " + _PROFILE_SET_SQL + ", updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    UPDATE_PASSWORD_SQL = (
+        "UPDATE users SET " + _PROFILE_SET_SQL
+        + ", password_hash = ?, salt = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    )
     
     @staticmethod
     def update(user_id: int, data: Dict) -> int:
         """Update user"""
-        # Build dynamic query based on provided data
-        fields = []
         values = []
+        for field in User.UPDATE_FIELDS:
+            values += (field in data, data.get(field))
         
-        for field in ['first_name', 'last_name', 'email', 'department', 'designation', 'phone']:
-            if field in data:
-                fields.append(f"{field} = ?")
-                values.append(data[field])
-        
-        if 'password' in data:
-            password_hash, salt = User.hash_password(data['password'])
-            fields.extend(['password_hash = ?', 'salt = ?'])
-            values.extend([password_hash, salt])
+        if 'password' not in data:
+            return Database.execute_query(User.UPDATE_SQL, tuple(values) + (user_id,))
         
-        fields.append('updated_at = ?')
-        values.append(datetime.now())
-        values.append(user_id)
-        
-        return Database.execute_query(
-            f"UPDATE users SET {', '.join(fields)} WHERE id = ?",
-            tuple(values)
-        )
+        password_hash, salt = User.hash_password(data['password'])
+        return Database.execute_query(User.UPDATE_PASSWORD_SQL, tuple(values) + (password_hash, salt, user_id))
     
     @staticmethod
     def delete(user_id: int) -> int:
         """Soft delete user"""
         return Database.execute_query(
-            "UPDATE users SET is_active = 0, updated_at = ? WHERE id = ?",
-            (datetime.now(), user_id)
+            "UPDATE users SET is_active = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (user_id,)
         )
 
 class Session:
     """Session management for secure authentication"""
     
+    # last_accessed is written in batches instead of a commit per lookup
+    _last_accessed = StampBuffer("UPDATE sessions SET last_accessed = ? WHERE id = ?", 2, 'session-last-accessed')
+    
     @staticmethod
     def create(user_id: int, ip_address: str = None, user_agent: str = None) -> tuple:
         """Create new session"""
@@ -191,11 +425,7 @@ class Session:
         )
         
         if session:
-            # Update last accessed
-            Database.execute_query(
-                "UPDATE sessions SET last_accessed = ? WHERE id = ?",
-                (datetime.now(), session_id)
-            )
+            Session._last_accessed.record(session_id, datetime.now())
         
         return session
     
@@ -252,26 +482,24 @@ class Project:
             data.get('client_name'), data.get('budget')
         ), 'lastrowid')
     
+    UPDATE_FIELDS = ('name', 'description', 'status', 'priority', 'start_date',
+                     'end_date', 'deadline', 'manager_id', 'client_name', 'budget')
+    # Fixed statement for every partial update (see Job.UPDATE_SQL), so it stays in the statement cache
+    UPDATE_SQL = (
+        "UPDATE projects SET "
+        + ", ".join(f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in UPDATE_FIELDS)
+        + ", updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    )
+    
     @staticmethod
     def update(project_id: int, data: Dict) -> int:
         """Update project"""
-        fields = []
         values = []
-        
-        for field in ['name', 'description', 'status', 'priority', 'start_date', 
-                     'end_date', 'deadline', 'manager_id', 'client_name', 'budget']:
-            if field in data:
-                fields.append(f"{field} = ?")
-                values.append(data[field])
-        
-        fields.append('updated_at = ?')
-        values.append(datetime.now())
+        for field in Project.UPDATE_FIELDS:
+            values += (field in data, data.get(field))
         values.append(project_id)
         
-        return Database.execute_query(
-            f"UPDATE projects SET {', '.join(fields)} WHERE id = ?",
-            tuple(values)
-        )
+        return Database.execute_query(Project.UPDATE_SQL, tuple(values))
     
     @staticmethod
     def delete(project_id: int) -> int:
@@ -307,27 +535,94 @@ class Task:
             ORDER BY t.created_at DESC
         ''', fetch='all')
     
+    INSERT_SQL = '''
+        INSERT INTO tasks (
+            project_id, title, description, status, priority,
+            assigned_to, assigned_by, estimated_hours, start_date, due_date
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
     @staticmethod
-    def create(data: Dict) -> int:
-        """Create new task"""
-        return Database.execute_query('''
-            INSERT INTO tasks (
-                project_id, title, description, status, priority,
-                assigned_to, assigned_by, estimated_hours, start_date, due_date
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    def _insert_params(data: Dict) -> tuple:
+        """Bind a task dict to INSERT_SQL"""
+        return (
             data.get('project_id'), data['title'], data.get('description'),
             data.get('status', 'todo'), data.get('priority', 'medium'),
             data.get('assigned_to'), data.get('assigned_by'), 
             data.get('estimated_hours'), data.get('start_date'), data.get('due_date')
-        ), 'lastrowid')
+        )
+    
+    @staticmethod
+    def create(data: Dict) -> int:
+        """Create new task"""
+        return Database.execute_query(Task.INSERT_SQL, Task._insert_params(data), 'lastrowid')
+    
+    @staticmethod
+    def create_many(rows: List[Dict]) -> List[int]:
+        """Create several tasks in one transaction"""
+        return Database.insert_many(Task.INSERT_SQL, [Task._insert_params(data) for data in rows])
 
 class Blog:
     """Blog management model"""
     
+    # View counts are buffered in memory and written in one batch instead of an UPDATE per read
+    VIEW_FLUSH_INTERVAL_SECONDS = 5
+    _pending_views = Counter()
+    _views_lock = threading.Lock()
+    _views_flusher = None
+    
+    # Public blog reads are cached briefly and dropped on any blog write; cached view counts
+    # lag by at most the TTL, on top of the flush interval above
+    CACHE_TTL_SECONDS = 30
+    CACHE_MAX_ENTRIES = 256
+    _cache = QueryCache(CACHE_MAX_ENTRIES)
+    
+    @staticmethod
+    def record_view(blog_id: int):
+        """Count a blog view; persisted by the background flusher"""
+        with Blog._views_lock:
+            Blog._pending_views[blog_id] += 1
+            if Blog._views_flusher is None:
+                Blog._views_flusher = threading.Thread(target=Blog._flush_views_forever,
+                                                       name='blog-views', daemon=True)
+                Blog._views_flusher.start()
+    
+    @staticmethod
+    def _flush_views_forever():
+        """Background loop writing buffered view counts"""
+        while True:
+            time.sleep(Blog.VIEW_FLUSH_INTERVAL_SECONDS)
+            Blog.flush_views()
+    
+    @staticmethod
+    def flush_views():
+        """Write buffered view counts with a single executemany"""
+        with Blog._views_lock:
+            pending, Blog._pending_views = Blog._pending_views, Counter()
+        
+        if not pending:
+            return
+        
+        try:
+            with Database.connection() as conn, conn:
+                conn.executemany(
+                    "UPDATE blogs SET views = views + ? WHERE id = ?",
+                    [(count, blog_id) for blog_id, count in pending.items()]
+                )
+        except Exception as e:
+            logger.error(f"Failed to flush blog views: {e}")
+            with Blog._views_lock:
+                Blog._pending_views.update(pending)
+    
     @staticmethod
     def get_published(blog_type: str = None) -> List[Dict]:
         """Get published blogs by type"""
+        return list(Blog._cache.get(('published', blog_type), Blog.CACHE_TTL_SECONDS,
+                                    lambda: Blog._load_published(blog_type)))
+    
+    @staticmethod
+    def _load_published(blog_type: str = None) -> List[Dict]:
+        """Query published blogs by type"""
         if blog_type:
             return Database.execute_query('''
                 SELECT b.*, u.first_name || ' ' || u.last_name as author_name
@@ -345,63 +640,106 @@ class Blog:
                 ORDER BY b.published_at DESC
             ''', fetch='all')
     
+    # Shared by both admin listings so each variant is a fixed string the statement cache can reuse
+    ADMIN_LIST_SQL = '''
+        SELECT b.*, u.first_name || ' ' || u.last_name as author_name
+        FROM blogs b
+        JOIN users u ON b.author_id = u.id
+        {where}
+        ORDER BY b.created_at DESC
+    '''
+    ADMIN_LIST_ALL_SQL = ADMIN_LIST_SQL.format(where='')
+    ADMIN_LIST_BY_TYPE_SQL = ADMIN_LIST_SQL.format(where='WHERE b.type = ?')
+    
+    @staticmethod
+    def get_all_admin(blog_type: str = None) -> List[Dict]:
+        """Get all blogs regardless of status, optionally filtered by type"""
+        if blog_type:
+            return Database.execute_query(Blog.ADMIN_LIST_BY_TYPE_SQL, (blog_type,), 'all')
+        return Database.execute_query(Blog.ADMIN_LIST_ALL_SQL, fetch='all')
+    
     @staticmethod
     def get_by_id(blog_id: int) -> Optional[Dict]:
         """Get blog by ID with author info"""
-        return Database.execute_query('''
+        blog = Blog._cache.get(('id', blog_id), Blog.CACHE_TTL_SECONDS, lambda: Database.execute_query('''
             SELECT b.*, u.first_name || ' ' || u.last_name as author_name
             FROM blogs b
             JOIN users u ON b.author_id = u.id
             WHERE b.id = ?
-        ''', (blog_id,), 'one')
+        ''', (blog_id,), 'one'))
+        return dict(blog) if blog else None
     
     @staticmethod
-    def create(data: Dict) -> int:
-        """Create new blog entry"""
+    def invalidate_cache():
+        """Drop cached blog reads after a blog is created, updated or deleted"""
+        Blog._cache.invalidate()
+    
+    INSERT_SQL = '''
+        INSERT INTO blogs (
+            title, type, content, excerpt, author_id, cover_image_path,
+            status, tags, published_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    @staticmethod
+    def _insert_params(data: Dict) -> tuple:
+        """Bind a blog dict to INSERT_SQL"""
         published_at = datetime.now() if data.get('status') == 'published' else None
-        
-        return Database.execute_query('''
-            INSERT INTO blogs (
-                title, type, content, excerpt, author_id, cover_image_path,
-                status, tags, published_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        return (
             data['title'], data['type'], data['content'], data.get('excerpt'),
             data['author_id'], data.get('cover_image_path'), 
             data.get('status', 'draft'), data.get('tags'), published_at
-        ), 'lastrowid')
+        )
+    
+    @staticmethod
+    def create(data: Dict) -> int:
+        """Create new blog entry"""
+        blog_id = Database.execute_query(Blog.INSERT_SQL, Blog._insert_params(data), 'lastrowid')
+        Blog.invalidate_cache()
+        return blog_id
+    
+    @staticmethod
+    def create_many(rows: List[Dict]) -> List[int]:
+        """Create several blog entries in one transaction"""
+        blog_ids = Database.insert_many(Blog.INSERT_SQL, [Blog._insert_params(data) for data in rows])
+        Blog.invalidate_cache()
+        return blog_ids
+    
+    UPDATE_FIELDS = ('title', 'type', 'content', 'excerpt', 'cover_image_path', 'status', 'tags')
+    # Fixed statement for every partial update (see Job.UPDATE_SQL), so it stays in the statement cache
+    UPDATE_SQL = (
+        "UPDATE blogs SET "
+        + ", ".join(f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in UPDATE_FIELDS)
+        + ", published_at = CASE WHEN ? THEN ? ELSE published_at END"
+        + ", updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    )
     
     @staticmethod
     def update(blog_id: int, data: Dict) -> int:
         """Update blog entry"""
-        fields = []
         values = []
+        for field in Blog.UPDATE_FIELDS:
+            values += (field in data, data.get(field))
         
-        for field in ['title', 'type', 'content', 'excerpt', 'cover_image_path', 'status', 'tags']:
-            if field in data:
-                fields.append(f"{field} = ?")
-                values.append(data[field])
-        
-        if 'status' in data and data['status'] == 'published':
-            fields.append('published_at = ?')
-            values.append(datetime.now())
-        
-        fields.append('updated_at = ?')
-        values.append(datetime.now())
-        values.append(blog_id)
+        # Set published_at when status changes to published
+        publishing = data.get('status') == 'published'
+        values += (publishing, datetime.now() if publishing else None, blog_id)
         
-        return Database.execute_query(
-            f"UPDATE blogs SET {', '.join(fields)} WHERE id = ?",
-            tuple(values)
-        )
+        rows_affected = Database.execute_query(Blog.UPDATE_SQL, tuple(values))
+        Blog.invalidate_cache()
+        return rows_affected
     
     @staticmethod
     def delete(blog_id: int) -> int:
         """Delete blog entry"""
-        return Database.execute_query(
+        rows_affected = Database.execute_query(
             "DELETE FROM blogs WHERE id = ?",
             (blog_id,)
         )
+        Blog.invalidate_cache()
+        return rows_affected
+
+atexit.register(Blog.flush_views)
 
 class Contact:
     """Contact inquiry model"""
@@ -428,196 +766,385 @@ class Contact:
 class AuditLog:
     """Security audit logging"""
     
+    # Entries are queued by request threads and inserted in batches by one writer thread
+    BATCH_SIZE = 1000
+    FLUSH_INTERVAL_SECONDS = 0.1
+    INSERT_SQL = '''
+        INSERT INTO audit_log (
+            user_id, action, resource_type, resource_id, details,
+            ip_address, ip_v4, user_agent_id, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    # User-agent strings are stored once in user_agents; the writer thread keeps their ids here
+    USER_AGENT_CACHE_SIZE = 1024
+    _user_agent_ids = {}
+    _queue = queue.Queue(maxsize=10000)
+    _writer = None
+    _writer_lock = threading.Lock()
+    
     @staticmethod
     def log(user_id: int, action: str, resource_type: str = None, 
-            resource_id: str = None, details: str = None,
-            ip_address: str = None, user_agent: str = None):
-        """Log security event"""
-        Database.execute_query('''
-            INSERT INTO audit_log (
-                user_id, action, resource_type, resource_id, details,
-                ip_address, user_agent
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (user_id, action, resource_type, resource_id, details, ip_address, user_agent))
+            resource_id: Any = None, details: str = None,
+            ip_address: str = None, user_agent: str = None, details_args: tuple = None):
+        """Log security event; details % details_args is formatted on the writer thread"""
+        if AuditLog._writer is None:
+            AuditLog._start_writer()
+        # created_at is taken now, in CURRENT_TIMESTAMP's format, so batching doesn't shift event times
+        created_at = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+        AuditLog._queue.put((user_id, action, resource_type, resource_id, details, ip_address, user_agent,
+                             created_at, details_args))
+    
+    @staticmethod
+    def _start_writer():
+        """Start the background writer thread once"""
+        with AuditLog._writer_lock:
+            if AuditLog._writer is None:
+                AuditLog._writer = threading.Thread(target=AuditLog._drain, name='audit-log-writer', daemon=True)
+                AuditLog._writer.start()
+    
+    @staticmethod
+    def flush():
+        """Block until every queued entry has been written"""
+        AuditLog._queue.join()
+    
+    @staticmethod
+    def _pack_ip(ip_address: str) -> tuple:
+        """Split an address into (ip_address, ip_v4) columns; IPv4 is stored as one integer"""
+        try:
+            return None, int.from_bytes(socket.inet_pton(socket.AF_INET, ip_address), 'big')
+        except (OSError, TypeError):
+            return ip_address, None
+    
+    @staticmethod
+    def _user_agent_id(conn: sqlite3.Connection, user_agent: str) -> Optional[int]:
+        """Return the user_agents id for user_agent, inserting it on first sight"""
+        if user_agent is None:
+            return None
+        
+        user_agent_id = AuditLog._user_agent_ids.get(user_agent)
+        if user_agent_id is None:
+            conn.execute("INSERT OR IGNORE INTO user_agents (ua) VALUES (?)", (user_agent,))
+            user_agent_id = conn.execute("SELECT id FROM user_agents WHERE ua = ?", (user_agent,)).fetchone()[0]
+            if len(AuditLog._user_agent_ids) >= AuditLog.USER_AGENT_CACHE_SIZE:
+                AuditLog._user_agent_ids.clear()
+            AuditLog._user_agent_ids[user_agent] = user_agent_id
+        return user_agent_id
+    
+    @staticmethod
+    def _drain():
+        """Writer loop: collect up to BATCH_SIZE entries or wait FLUSH_INTERVAL_SECONDS, then insert"""
+        while True:
+            rows = [AuditLog._queue.get()]
+            deadline = time.monotonic() + AuditLog.FLUSH_INTERVAL_SECONDS
+            
+            while len(rows) < AuditLog.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(AuditLog._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                conn = Database.get_pooled_connection()
+                with conn:
+                    entries = []
+                    for row in rows:
+                        # A bad entry (e.g. details that don't match details_args) only loses itself
+                        try:
+                            # resource_id is stored as TEXT by column affinity, so callers can pass raw ids
+                            entries.append(
+                                row[:4] + (row[4] % row[8] if row[8] else row[4],) + AuditLog._pack_ip(row[5])
+                                + (AuditLog._user_agent_id(conn, row[6]), row[7])
+                            )
+                        except Exception as e:
+                            logger.error("Skipping audit log entry %r: %s", row[1], e)
+                    conn.executemany(AuditLog.INSERT_SQL, entries)
+            except Exception as e:
+                # Ids cached during a rolled-back batch may not exist
+                AuditLog._user_agent_ids.clear()
+                logger.error("Failed to write %d audit log entries: %s", len(rows), e)
+            
+            for _ in rows:
+                AuditLog._queue.task_done()
     
     @staticmethod
     def get_recent(limit: int = 100) -> List[Dict]:
         """Get recent audit log entries"""
+        AuditLog.flush()
         return Database.execute_query('''
-            SELECT a.*, u.username
+            SELECT a.id, a.user_id, a.action, a.resource_type, a.resource_id, a.details,
+                   COALESCE(a.ip_address, (a.ip_v4 >> 24) || '.' || ((a.ip_v4 >> 16) & 255) || '.' ||
+                            ((a.ip_v4 >> 8) & 255) || '.' || (a.ip_v4 & 255)) AS ip_address,
+                   COALESCE(a.user_agent, ua.ua) AS user_agent, a.created_at, u.username
             FROM audit_log a
+            LEFT JOIN user_agents ua ON a.user_agent_id = ua.id
             LEFT JOIN users u ON a.user_id = u.id
             ORDER BY a.created_at DESC
             LIMIT ?
         ''', (limit,), 'all')
 
+atexit.register(AuditLog.flush)
+
 class RateLimit:
     """Rate limiting for API endpoints"""
     
+    # In-process token buckets keyed by (ip_address, endpoint); no database write per request.
+    # State is per server process and resets on restart, which is fine for abuse throttling.
+    MAX_TRACKED_CLIENTS = 10000
+    _buckets = TokenBucket(MAX_TRACKED_CLIENTS)
+    
     @staticmethod
     def check_rate_limit(ip_address: str, endpoint: str, max_requests: int = 100, 
                         window_minutes: int = 15) -> bool:
-        """Check if request is within rate limit"""
-        window_start = datetime.now() - timedelta(minutes=window_minutes)
-        
-        # Get current request count
-        current = Database.execute_query('''
-            SELECT requests FROM rate_limits 
-            WHERE ip_address = ? AND endpoint = ? AND window_start > ?
-        ''', (ip_address, endpoint, window_start), 'one')
-        
-        if not current:
-            # First request in window
-            Database.execute_query('''
-                INSERT OR REPLACE INTO rate_limits (ip_address, endpoint, requests, window_start)
-                VALUES (?, ?, 1, ?)
-            ''', (ip_address, endpoint, datetime.now()))
-            return True
-        
-        if current['requests'] >= max_requests:
-            return False
-        
-        # Increment request count
-        Database.execute_query('''
-            UPDATE rate_limits SET requests = requests + 1
-            WHERE ip_address = ? AND endpoint = ?
-        ''', (ip_address, endpoint))
-        
-        return True
+        """Check if request is within rate limit (burst of max_requests, refilled over the window)"""
+        refill_per_second = max_requests / (window_minutes * 60)
+        return RateLimit._buckets.take((ip_address, endpoint), max_requests, refill_per_second)
 
 class Job:
     """Job posting management model"""
     
+    # Careers-page data changes rarely; cache it briefly and drop it on any job write
+    PUBLISHED_CACHE_TTL_SECONDS = 60
+    FILTERS_CACHE_TTL_SECONDS = 300
+    CACHE_MAX_ENTRIES = 128
+    _cache = QueryCache(CACHE_MAX_ENTRIES)
+    
+    @staticmethod
+    def _cached(key: Any, ttl: int, loader) -> List:
+        """Return a cached listing, reloading it once ttl seconds have passed"""
+        return list(Job._cache.get(key, ttl, loader))
+    
+    @staticmethod
+    def invalidate_cache():
+        """Drop cached listings after a job is created, updated or deleted"""
+        Job._cache.invalidate()
+    
+    @staticmethod
+    def _format_published_at(job: Optional[Dict]) -> Optional[Dict]:
+        """Render published_at (stored as Unix seconds) in the UTC text format of CURRENT_TIMESTAMP"""
+        if job and isinstance(job['published_at'], int):
+            job['published_at'] = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(job['published_at']))
+        return job
+    
+    @staticmethod
+    def _format_all(jobs: List[Dict]) -> List[Dict]:
+        """Apply _format_published_at to every row of a listing"""
+        for job in jobs:
+            Job._format_published_at(job)
+        return jobs
+    
     @staticmethod
     def get_published() -> List[Dict]:
         """Get all published job postings"""
-        return Database.execute_query('''
+        return Job._cached('published', Job.PUBLISHED_CACHE_TTL_SECONDS, lambda: Job._format_all(Database.execute_query('''
             SELECT j.*, u.first_name || ' ' || u.last_name as posted_by_name
             FROM jobs j
             LEFT JOIN users u ON j.posted_by = u.id
             WHERE j.status = 'published'
             ORDER BY j.published_at DESC
-        ''', fetch='all')
+        ''', fetch='all')))
     
     @staticmethod
     def get_by_filters(department: str = None, location: str = None, 
-                      job_type: str = None, experience_level: str = None) -> List[Dict]:
-        """Get published jobs with filters"""
-        query = '''
-            SELECT j.*, u.first_name || ' ' || u.last_name as posted_by_name
-            FROM jobs j
-            LEFT JOIN users u ON j.posted_by = u.id
-            WHERE j.status = 'published'
-        '''
+                      job_type: str = None, experience_level: str = None,
+                      limit: int = None, offset: int = 0) -> List[Dict]:
+        """Get published jobs with filters, optionally one page at a time"""
+        key = ('filtered', department, location, job_type, experience_level, limit, offset)
+        return Job._cached(key, Job.PUBLISHED_CACHE_TTL_SECONDS,
+                           lambda: Job._query_by_filters(department, location, job_type, experience_level,
+                                                         limit, offset))
+    
+    @staticmethod
+    def count_by_filters(department: str = None, location: str = None,
+                         job_type: str = None, experience_level: str = None) -> int:
+        """Count published jobs matching the filters"""
+        key = ('count', department, location, job_type, experience_level)
+        
+        def load():
+            where, params = Job._filter_clause(department, location, job_type, experience_level)
+            return [Database.execute_query(f"SELECT COUNT(*) AS total FROM jobs j {where}", params, 'one')['total']]
+        
+        return Job._cached(key, Job.PUBLISHED_CACHE_TTL_SECONDS, load)[0]
+    
+    @staticmethod
+    def _filter_clause(department: str, location: str, job_type: str, experience_level: str) -> tuple:
+        """Build the WHERE clause and parameters for the published-jobs filters"""
+        where = "WHERE j.status = 'published'"
         params = []
         
         if department:
-            query += " AND j.department = ?"
+            where += " AND j.department = ?"
             params.append(department)
         if location:
-            query += " AND j.location LIKE ?"
+            where += " AND j.location LIKE ?"
             params.append(f"%{location}%")
         if job_type:
-            query += " AND j.job_type = ?"
+            where += " AND j.job_type = ?"
             params.append(job_type)
         if experience_level:
-            query += " AND j.experience_level = ?"
+            where += " AND j.experience_level = ?"
             params.append(experience_level)
         
-        query += " ORDER BY j.published_at DESC"
+        return where, tuple(params)
+    
+    @staticmethod
+    def _query_by_filters(department: str, location: str, job_type: str, experience_level: str,
+                          limit: int = None, offset: int = 0) -> List[Dict]:
+        """Run the filtered published-jobs query"""
+        where, params = Job._filter_clause(department, location, job_type, experience_level)
+        query = f'''
+            SELECT j.*, u.first_name || ' ' || u.last_name as posted_by_name
+            FROM jobs j
+            LEFT JOIN users u ON j.posted_by = u.id
+            {where}
+            ORDER BY j.published_at DESC
+        '''
+        
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
         
-        return Database.execute_query(query, tuple(params), 'all')
+        return Job._format_all(Database.execute_query(query, params, 'all'))
     
     @staticmethod
     def get_by_id(job_id: int) -> Optional[Dict]:
         """Get job by ID with poster info"""
-        return Database.execute_query('''
+        return Job._format_published_at(Database.execute_query('''
             SELECT j.*, u.first_name || ' ' || u.last_name as posted_by_name
             FROM jobs j
             LEFT JOIN users u ON j.posted_by = u.id
             WHERE j.id = ?
-        ''', (job_id,), 'one')
+        ''', (job_id,), 'one'))
     
     @staticmethod
     def get_all() -> List[Dict]:
         """Get all jobs (admin view)"""
-        return Database.execute_query('''
+        return Job._format_all(Database.execute_query('''
             SELECT j.*, u.first_name || ' ' || u.last_name as posted_by_name
             FROM jobs j
             LEFT JOIN users u ON j.posted_by = u.id
             ORDER BY j.created_at DESC
-        ''', fetch='all')
+        ''', fetch='all'))
+    
+    INSERT_SQL = '''
+        INSERT INTO jobs (
+            title, department, location, job_type, experience_level,
+            description, requirements, responsibilities, benefits,
+            salary_min, salary_max, application_deadline, status,
+            posted_by, published_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
     
     @staticmethod
-    def create(data: Dict) -> int:
-        """Create new job posting"""
-        published_at = datetime.now() if data.get('status') == 'published' else None
-        
-        return Database.execute_query('''
-            INSERT INTO jobs (
-                title, department, location, job_type, experience_level,
-                description, requirements, responsibilities, benefits,
-                salary_min, salary_max, application_deadline, status,
-                posted_by, published_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    def _insert_params(data: Dict) -> tuple:
+        """Bind a job dict to INSERT_SQL"""
+        published_at = int(time.time()) if data.get('status') == 'published' else None
+        return (
             data['title'], data['department'], data['location'],
             data.get('job_type', 'full-time'), data.get('experience_level', 'mid'),
             data['description'], data.get('requirements'), data.get('responsibilities'),
             data.get('benefits'), data.get('salary_min'), data.get('salary_max'),
             data.get('application_deadline'), data.get('status', 'draft'),
             data['posted_by'], published_at
-        ), 'lastrowid')
+        )
     
     @staticmethod
-    def update(job_id: int, data: Dict) -> int:
-        """Update job posting"""
-        fields = []
-        values = []
-        
-        for field in ['title', 'department', 'location', 'job_type', 'experience_level',
+    def create(data: Dict) -> int:
+        """Create new job posting"""
+        job_id = Database.execute_query(Job.INSERT_SQL, Job._insert_params(data), 'lastrowid')
+        Job.invalidate_cache()
+        return job_id
+    
+    @staticmethod
+    def create_many(rows: List[Dict]) -> List[int]:
+        """Create several job postings in one transaction"""
+        job_ids = Database.insert_many(Job.INSERT_SQL, [Job._insert_params(data) for data in rows])
+        Job.invalidate_cache()
+        return job_ids
+    
+    UPDATE_FIELDS = ('title', 'department', 'location', 'job_type', 'experience_level',
                      'description', 'requirements', 'responsibilities', 'benefits',
-                     'salary_min', 'salary_max', 'application_deadline', 'status']:
-            if field in data:
-                fields.append(f"{field} = ?")
-                values.append(data[field])
+                     'salary_min', 'salary_max', 'application_deadline', 'status')
+    # One fixed statement for every partial update: each column takes a (provided, value) pair,
+    # so the prepared statement is reused no matter which fields a request sends
+    UPDATE_SQL = (
+        "UPDATE jobs SET "
+        + ", ".join(f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in UPDATE_FIELDS)
+        + ", published_at = CASE WHEN ? THEN ? ELSE published_at END"
+        + ", updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    )
+    
+    UPDATE_RETURNING_SQL = UPDATE_SQL + " RETURNING *"
+    
+    @staticmethod
+    def _update_params(job_id: int, data: Dict) -> tuple:
+        """Bind the (provided, value) pairs for UPDATE_SQL"""
+        values = []
+        for field in Job.UPDATE_FIELDS:
+            values += (field in data, data.get(field))
         
         # Set published_at when status changes to published
-        if 'status' in data and data['status'] == 'published':
-            fields.append('published_at = ?')
-            values.append(datetime.now())
-        
-        fields.append('updated_at = ?')
-        values.append(datetime.now())
-        values.append(job_id)
-        
-        return Database.execute_query(
-            f"UPDATE jobs SET {', '.join(fields)} WHERE id = ?",
-            tuple(values)
-        )
+        publishing = data.get('status') == 'published'
+        values += (publishing, int(time.time()) if publishing else None, job_id)
+        return tuple(values)
+    
+    @staticmethod
+    def update(job_id: int, data: Dict) -> int:
+        """Update job posting"""
+        rows_affected = Database.execute_query(Job.UPDATE_SQL, Job._update_params(job_id, data))
+        Job.invalidate_cache()
+        return rows_affected
+    
+    @staticmethod
+    def update_returning(job_id: int, data: Dict) -> Optional[Dict]:
+        """Update job posting and return the updated row, or None if it did not exist"""
+        updated = Database.execute_query(Job.UPDATE_RETURNING_SQL, Job._update_params(job_id, data), 'one')
+        if updated:
+            Job.invalidate_cache()
+        return Job._format_published_at(updated)
     
     @staticmethod
     def delete(job_id: int) -> int:
         """Delete job posting"""
-        return Database.execute_query(
+        rows_affected = Database.execute_query(
             "DELETE FROM jobs WHERE id = ?",
             (job_id,)
         )
+        Job.invalidate_cache()
+        return rows_affected
+    
+    @staticmethod
+    def delete_returning(job_id: int) -> Optional[Dict]:
+        """Delete job posting and return its title, or None if it did not exist"""
+        deleted = Database.execute_query(
+            "DELETE FROM jobs WHERE id = ? RETURNING title",
+            (job_id,),
+            'one'
+        )
+        if deleted:
+            Job.invalidate_cache()
+        return deleted
+    
+    @staticmethod
+    def _filter_options() -> List[List[str]]:
+        """Load [departments, locations] together from one covered scan of idx_jobs_public_filter"""
+        def load():
+            rows = Database.execute_query(
+                "SELECT DISTINCT department, location FROM jobs WHERE status = 'published'",
+                fetch='all'
+            )
+            return [sorted({row['department'] for row in rows}), sorted({row['location'] for row in rows})]
+        
+        return Job._cached('filter_options', Job.FILTERS_CACHE_TTL_SECONDS, load)
     
     @staticmethod
     def get_departments() -> List[str]:
         """Get distinct departments for filtering"""
-        results = Database.execute_query(
-            "SELECT DISTINCT department FROM jobs WHERE status = 'published' ORDER BY department",
-            fetch='all'
-        )
-        return [row['department'] for row in results]
+        return Job._filter_options()[0]
     
     @staticmethod
     def get_locations() -> List[str]:
         """Get distinct locations for filtering"""
-        results = Database.execute_query(
-            "SELECT DISTINCT location FROM jobs WHERE status = 'published' ORDER BY location",
-            fetch='all'
-        )
-        return [row['location'] for row in results]
\ No newline at end of file
+        return Job._filter_options()[1]
\ No newline at end of file
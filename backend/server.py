@@ -10,6 +10,7 @@ import sys
 import json
 import mimetypes
 from wsgiref.simple_server import make_server, WSGIServer
+from socketserver import ThreadingMixIn
 from urllib.parse import parse_qs, urlparse
 import logging
 from datetime import datetime
@@ -20,7 +21,7 @@ sys.path.append(os.path.dirname(__file__))
 
 from models import Database, User, Session, Project, Task, Blog, Contact, AuditLog, RateLimit
 from middleware import SecurityMiddleware, AuthMiddleware
-from controllers import AuthController, EmployeeController, ProjectController, BlogController, ContactController, JobController
+from controllers import AuthController, EmployeeController, ProjectController, BlogController, ContactController, JobController, RequestContext
 from auth import init_auth_service
 
 # Configure logging
@@ -34,6 +35,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared response encoder: built once, compact separators, str() for dates and other non-JSON types.
+# Without indent, encode() runs json's C accelerator (c_make_encoder) over the whole payload.
+JSON_ENCODER = json.JSONEncoder(default=str, separators=(',', ':'))
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
 class MatricaWSGIApp:
     """Main WSGI application with routing and middleware"""
     
@@ -119,7 +125,7 @@ class MatricaWSGIApp:
             user_agent = environ.get('HTTP_USER_AGENT', 'unknown')
             
             # Log request
-            logger.info(f"{method} {path} - {client_ip}")
+            logger.info("%s %s - %s", method, path, client_ip)
             
             # Apply security middleware
             security_result = self.security_middleware.process_request(environ)
@@ -128,7 +134,7 @@ class MatricaWSGIApp:
             
             # Rate limiting (handled by auth service for auth endpoints)
             # if not RateLimit.check_rate_limit(client_ip, path):
-            #     logger.warning(f"Rate limit exceeded for {client_ip} on {path}")
+            #     logger.warning("Rate limit exceeded for %s on %s", client_ip, path)
             #     return self._error_response(start_response, 429, {'error': 'Rate limit exceeded'})
             
             # Handle API routes
@@ -139,7 +145,7 @@ class MatricaWSGIApp:
             return self._serve_static(environ, start_response, path)
             
         except Exception as e:
-            logger.error(f"Server error: {str(e)}")
+            logger.error("Server error: %s", e, exc_info=True)
             return self._error_response(start_response, 500, {'error': 'Internal server error'})
     
     def _handle_api(self, environ, start_response, method: str, path: str, 
@@ -176,16 +182,17 @@ class MatricaWSGIApp:
                 session = auth_result
             
             # Prepare request context
-            request_context = {
-                'method': method,
-                'path': path,
-                'body': request_body,
-                'query': query_params,
-                'params': params,
-                'session': session,
-                'client_ip': client_ip,
-                'user_agent': user_agent
-            }
+            request_context = RequestContext(
+                method=method,
+                path=path,
+                body=request_body,
+                query=query_params,
+                params=params,
+                session=session,
+                client_ip=client_ip,
+                user_agent=user_agent,
+                session_token=session['session_token'] if session else None
+            )
             
             # Call handler
             response = handler(request_context)
@@ -194,7 +201,7 @@ class MatricaWSGIApp:
             return self._json_response(start_response, 200, response)
             
         except Exception as e:
-            logger.error(f"API error: {str(e)}")
+            logger.error("API error: %s", e)
             return self._error_response(start_response, 500, {'error': 'Internal server error'})
     
     def _match_route(self, method: str, path: str) -> Tuple[Optional[str], Dict]:
@@ -279,16 +286,17 @@ class MatricaWSGIApp:
             return [content]
             
         except Exception as e:
-            logger.error(f"Error serving static file {file_path}: {str(e)}")
+            logger.error("Error serving static file %s: %s", file_path, e)
             return self._error_response(start_response, 500, {'error': 'Server error'})
     
     def _json_response(self, start_response, status_code: int, data: Dict):
         """Return JSON response"""
-        response_body = json.dumps(data, default=str).encode('utf-8')
+        # ensure_ascii is on, so the text is pure ASCII and its length is the byte length
+        response_text = JSON_ENCODER.encode(data)
         
         headers = [
             ('Content-Type', 'application/json'),
-            ('Content-Length', str(len(response_body))),
+            ('Content-Length', str(len(response_text))),
             ('X-Content-Type-Options', 'nosniff'),
             ('X-Frame-Options', 'DENY'),
             ('X-XSS-Protection', '1; mode=block')
@@ -296,23 +304,28 @@ class MatricaWSGIApp:
         
         status_text = f"{status_code} OK" if status_code == 200 else f"{status_code} Error"
         start_response(status_text, headers)
-        return [response_body]
+        
+        if len(response_text) <= RESPONSE_CHUNK_SIZE:
+            return [response_text.encode('ascii')]
+        # Large listings go out in chunks instead of being copied into one full-size bytes object
+        return (response_text[i:i + RESPONSE_CHUNK_SIZE].encode('ascii')
+                for i in range(0, len(response_text), RESPONSE_CHUNK_SIZE))
     
     def _error_response(self, start_response, status_code: int, data: Dict):
         """Return error response"""
         return self._json_response(start_response, status_code, data)
     
-    def get_audit_log(self, request_context: Dict) -> Dict:
+    def get_audit_log(self, request_context: RequestContext) -> Dict:
         """Get audit log (admin only)"""
-        if not request_context['session'] or request_context['session']['user']['role'] != 'admin':
+        if not request_context.session or request_context.session['user']['role'] != 'admin':
             raise Exception("Unauthorized")
         
         logs = AuditLog.get_recent(50)
         return {'logs': logs}
     
-    def get_dashboard_stats(self, request_context: Dict) -> Dict:
+    def get_dashboard_stats(self, request_context: RequestContext) -> Dict:
         """Get dashboard statistics (admin only)"""
-        if not request_context['session'] or request_context['session']['user']['role'] != 'admin':
+        if not request_context.session or request_context.session['user']['role'] != 'admin':
             raise Exception("Unauthorized")
         
         # Get various statistics
@@ -330,8 +343,12 @@ class MatricaWSGIApp:
             }
         }
 
-class ThreadingWSGIServer(WSGIServer):
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
     """Multi-threaded WSGI server"""
+    # One thread per connection so a slow DB call or PBKDF2 hash no longer blocks every other client
+    daemon_threads = True
+    request_queue_size = 128
+    
     def server_bind(self):
         super().server_bind()
         self.server_name = "Matrica-Server"